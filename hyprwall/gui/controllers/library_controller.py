@@ -20,6 +20,8 @@ The controller manipulates widgets through the provided `window` reference.
 
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
@@ -27,34 +29,104 @@ try:
 
     gi.require_version("Gtk", "4.0")
     gi.require_version("Adw", "1")
-    from gi.repository import Gtk, GLib, Pango
+    from gi.repository import Gdk, Gio, GObject, Gtk, GLib, Pango
 except (ImportError, ValueError) as e:  # pragma: no cover
     raise RuntimeError("GTK4 or libadwaita not available") from e
 
 
+# Icon names shared by every row/card; interned once at module level
+VIDEO_ICON = "video-x-generic-symbolic"
+IMAGE_ICON = "image-x-generic-symbolic"
+
+
+@dataclass(slots=True)
+class LibraryState:
+    """Pure-Python library/pagination/search state.
+
+    Slots instead of a per-instance dict: the preview/search hot paths
+    hit these attributes repeatedly, and fixed slot offsets are cheaper
+    than dict lookups. The window shares this object by reference.
+    """
+
+    library_items: list = field(default_factory=list)
+    library_folder: Path | None = None
+    all_items: list = field(default_factory=list)
+    page_size: int = 15
+    page_index: int = 0
+    total_pages: int = 1
+    all_search_items: list = field(default_factory=list)
+    filtered_search_items: list = field(default_factory=list)
+    search_loaded: bool = False
+
+
+class _SearchEntry(GObject.Object):
+    """GObject wrapper so core MediaItem objects can live in a Gio.ListStore."""
+
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+
+
 class LibraryController:
     def __init__(self, window, core, *, lazy_loading: bool = False):
         self.window = window
         self.core = core
         self.lazy_loading = lazy_loading
 
-        # Library state (kept local to controller)
-        self._library_items = []
-        self._library_folder: Path | None = None
-
-        # Pagination state
-        self._all_items = []
-        self._page_size = 15
-        self._page_index = 0
-        self._total_pages = 1
-
-        # Search state
-        self._all_search_items = []
-        self._filtered_search_items = []
-        self._search_loaded = False
+        # Library/pagination/search state, shared with the window by reference
+        self._state = LibraryState()
+        window._state = self._state
+
+        self._search_model: Gio.ListStore | None = None
+        self._search_debounce_id: int | None = None
+
+        # Background scan state. Monotonic token: each _load_library bumps it,
+        # and in-flight scan callbacks compare against it before touching UI.
+        self._scan_generation = 0
+
+        # Producer/consumer buffer between the scan thread and the main loop:
+        # batches accumulate here and a single pending idle callback drains
+        # them, instead of one idle_add (and main-thread wake-up) per batch.
+        self._pending_batches: list = []
+        self._batch_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        # Icon paintables resolved once per (name, size); every row/card icon
+        # after that is a pointer assignment instead of an icon-theme lookup.
+        self._icon_paintables: dict = {}
+
+    @staticmethod
+    def _index_items(items):
+        """Attach precomputed display strings to items entering the controller.
+
+        `Path.name` is a property that re-splits the string and search lowers
+        it per keystroke; compute both once here so render and filter loops
+        touch plain string attributes. MediaItem is a frozen dataclass, so
+        the render-only caches are attached via object.__setattr__ to keep
+        hyprwall.core untouched.
+        """
+        for item in items:
+            name = item.path.name
+            object.__setattr__(item, "_name", name)
+            object.__setattr__(item, "_name_lower", name.lower())
+        return items
+
+    def _icon_paintable(self, icon_name: str, pixel_size: int = 16):
+        """Resolve (and cache) an icon paintable."""
+        paintable = self._icon_paintables.get((icon_name, pixel_size))
+        if paintable is None:
+            theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+            paintable = theme.lookup_icon(
+                icon_name, None, pixel_size, 1, Gtk.TextDirection.NONE, 0
+            )
+            self._icon_paintables[(icon_name, pixel_size)] = paintable
+        return paintable
 
-        # Background scan state
-        self._scan_cancelled = False
+    def _icon_image(self, icon_name: str, pixel_size: int = 16) -> Gtk.Image:
+        """Create a Gtk.Image from a cached icon paintable."""
+        image = Gtk.Image()
+        image.set_from_paintable(self._icon_paintable(icon_name, pixel_size))
+        return image
 
     # ---- Public API expected by prompt ----
 
@@ -71,20 +143,27 @@ class LibraryController:
 
     # ---- Delegated handlers (keep names on window side; these are called by wrappers) ----
 
-    def _load_library(self, folder: Path):
-        """Load media library - synchronous or lazy depending on flag."""
-        # Cancel any ongoing scan
-        self._scan_cancelled = True
+    def _load_library(self, folder: Path, *, background: bool = False):
+        """Load media library - synchronous or lazy depending on flag.
+
+        `background=True` forces the threaded scan path regardless of the
+        lazy_loading flag; used at startup so window construction never
+        blocks on a full recursive scan of the default library.
+        """
+        # Invalidate any ongoing scan: its captured generation no longer matches.
+        self._scan_generation += 1
+        my_gen = self._scan_generation
 
         # Store folder
-        self._library_folder = folder
-        self._library_items = []
+        self._state.library_folder = folder
+        self._state.library_items = []
+        self._state.all_items = []
 
         # Changing library folder invalidates search cache (matches previous behavior
         # effectively, because search loads based on current folder and relies on _library_folder).
-        self._all_search_items = []
-        self._filtered_search_items = []
-        self._search_loaded = False
+        self._state.all_search_items = []
+        self._state.filtered_search_items = []
+        self._state.search_loaded = False
 
         # KEEP library container visible to avoid layout jump
         if getattr(self.window, "library_container", None):
@@ -97,29 +176,29 @@ class LibraryController:
         # Freeze window size to prevent Wayland recentering
         self.window._freeze_window_size()
 
-        if self.lazy_loading:
+        if self.lazy_loading or background:
             # === LAZY MODE (background thread) ===
-            self._scan_cancelled = False
-            import threading
+            with self._batch_lock:
+                self._pending_batches.clear()
 
             thread = threading.Thread(
                 target=self._scan_library_thread,
-                args=(folder,),
+                args=(folder, my_gen),
                 daemon=True,
             )
             thread.start()
         else:
             # === SYNCHRONOUS MODE (baseline for debugging) ===
-            items = self.core.list_library(folder, recursive=True)
+            items = self._index_items(self.core.list_library(folder, recursive=True))
 
             # Store all items for pagination
-            self._all_items = items
-            self._page_index = 0
+            self._state.all_items = items
+            self._state.page_index = 0
 
             # Calculate total pages
             import math
 
-            self._total_pages = max(1, math.ceil(len(self._all_items) / self._page_size))
+            self._state.total_pages = max(1, math.ceil(len(self._state.all_items) / self._state.page_size))
 
             # Render first page
             self._render_current_page()
@@ -134,40 +213,84 @@ class LibraryController:
             # Update status
             self.window._refresh_status()
 
-    def _scan_library_thread(self, folder: Path):
-        """Background thread for scanning library (calls core API only)."""
-        try:
-            all_items = []
+    def _scan_library_thread(self, folder: Path, my_gen: int):
+        """Background thread for scanning library (calls core API only).
 
-            # Iterate over batches from core API and accumulate
+        Streams each batch to the UI as it arrives, so the first page of cards
+        renders after one batch instead of after the full scan.
+        """
+        try:
             for batch in self.core.iter_library(folder, recursive=True, batch_size=50):
-                if self._scan_cancelled:
+                if my_gen != self._scan_generation:
                     return
-                all_items.extend(batch)
+                with self._batch_lock:
+                    self._pending_batches.append((my_gen, batch))
+                    schedule = not self._flush_scheduled
+                    if schedule:
+                        self._flush_scheduled = True
+                if schedule:
+                    GLib.idle_add(self._flush_scan_batches)
 
-            if not self._scan_cancelled:
-                GLib.idle_add(self._on_library_scan_complete_with_items, all_items)
+            if my_gen == self._scan_generation:
+                GLib.idle_add(self._on_library_scan_finalize, my_gen)
 
         except Exception as e:
+            if my_gen != self._scan_generation:
+                return
             GLib.idle_add(self.window._unfreeze_window_size)
             GLib.idle_add(self.window._show_error, f"Library scan error: {e}")
             GLib.idle_add(self.window._refresh_status)
 
-    def _on_library_scan_complete_with_items(self, items):
-        """Called when library scan completes - setup pagination and render first page."""
-        self._all_items = items
-        self._page_index = 0
+    def _flush_scan_batches(self):
+        """Drain all pending scan batches in one main-thread callback."""
+        with self._batch_lock:
+            entries = self._pending_batches
+            self._pending_batches = []
+            self._flush_scheduled = False
+
+        # A flush scheduled during a previous scan can drain batches the
+        # new scan's worker already queued (it saw _flush_scheduled and
+        # skipped its own idle_add), so filter per batch instead of
+        # discarding the whole drain on a generation mismatch
+        batches = [batch for gen, batch in entries if gen == self._scan_generation]
+        if not batches:
+            return False
+
+        first_batch = not self._state.all_items
+        for batch in batches:
+            self._state.all_items.extend(self._index_items(batch))
 
         import math
 
-        self._total_pages = max(1, math.ceil(len(self._all_items) / self._page_size))
+        self._state.total_pages = max(1, math.ceil(len(self._state.all_items) / self._state.page_size))
 
-        self._render_current_page()
+        if first_batch:
+            self._state.page_index = 0
+            self._render_current_page()
 
-        if getattr(self.window, "library_outer_stack", None):
-            self.window.library_outer_stack.set_visible_child_name("content")
+            if getattr(self.window, "library_outer_stack", None):
+                self.window.library_outer_stack.set_visible_child_name("content")
+
+            self.window._unfreeze_window_size()
+        else:
+            # Current page is already rendered; only the page count changed.
+            self._update_pagination_ui()
+
+        return False
+
+    def _on_library_scan_finalize(self, my_gen: int):
+        """Called after the last batch - handle the empty library and status."""
+        if my_gen != self._scan_generation:
+            return False
+
+        if not self._state.all_items:
+            self._render_current_page()
+
+            if getattr(self.window, "library_outer_stack", None):
+                self.window.library_outer_stack.set_visible_child_name("content")
+
+            self.window._unfreeze_window_size()
 
-        self.window._unfreeze_window_size()
         self.window._refresh_status()
         return False
 
@@ -176,18 +299,18 @@ class LibraryController:
         if getattr(self.window, "library_grid", None):
             self.window.library_grid.remove_all()
 
-        if not self._all_items:
+        if not self._state.all_items:
             self._show_no_media_message()
             if getattr(self.window, "pagination_bar", None):
                 self.window.pagination_bar.set_visible(False)
             return
 
-        start_idx = self._page_index * self._page_size
-        end_idx = min(start_idx + self._page_size, len(self._all_items))
-        page_items = self._all_items[start_idx:end_idx]
+        start_idx = self._state.page_index * self._state.page_size
+        end_idx = min(start_idx + self._state.page_size, len(self._state.all_items))
+        page_items = self._state.all_items[start_idx:end_idx]
 
         # Store current page items for compatibility
-        self._library_items = page_items
+        self._state.library_items = page_items
 
         self._render_grid_view(page_items)
         self._update_pagination_ui()
@@ -196,36 +319,44 @@ class LibraryController:
         if not getattr(self.window, "pagination_bar", None):
             return
 
-        if self._total_pages > 1:
+        if self._state.total_pages > 1:
             self.window.pagination_bar.set_visible(True)
         else:
             self.window.pagination_bar.set_visible(False)
             return
 
         if getattr(self.window, "page_label", None):
-            current_page = self._page_index + 1
-            self.window.page_label.set_label(f"Page {current_page} / {self._total_pages}")
+            current_page = self._state.page_index + 1
+            self.window.page_label.set_label(f"Page {current_page} / {self._state.total_pages}")
 
         if getattr(self.window, "page_prev", None):
-            self.window.page_prev.set_sensitive(self._page_index > 0)
+            self.window.page_prev.set_sensitive(self._state.page_index > 0)
 
         if getattr(self.window, "page_next", None):
-            self.window.page_next.set_sensitive(self._page_index < self._total_pages - 1)
+            self.window.page_next.set_sensitive(self._state.page_index < self._state.total_pages - 1)
 
     def _on_page_prev(self, button):
-        if self._page_index > 0:
-            self._page_index -= 1
+        if self._state.page_index > 0:
+            self._state.page_index -= 1
             self._render_current_page()
 
     def _on_page_next(self, button):
-        if self._page_index < self._total_pages - 1:
-            self._page_index += 1
+        if self._state.page_index < self._state.total_pages - 1:
+            self._state.page_index += 1
             self._render_current_page()
 
     # ----- Search -----
 
     def _on_library_search_changed(self, entry):
-        query = entry.get_text().strip().lower()
+        # Debounce: each keystroke restarts a short timer so only the final
+        # query of a typing burst filters and re-renders the result list.
+        if self._search_debounce_id is not None:
+            GLib.source_remove(self._search_debounce_id)
+        self._search_debounce_id = GLib.timeout_add(120, self._do_search, entry.get_text())
+
+    def _do_search(self, text: str):
+        self._search_debounce_id = None
+        query = text.strip().lower()
 
         if not query:
             self.window.library_stack.set_visible_child_name("gallery")
@@ -236,82 +367,149 @@ class LibraryController:
                 self.window.library_search_preview_container.set_visible(False)
 
             if getattr(self.window, "pagination_bar", None):
-                if self._total_pages > 1:
+                if self._state.total_pages > 1:
                     self.window.pagination_bar.set_visible(True)
                 else:
                     self.window.pagination_bar.set_visible(False)
             return
 
-        if not self._search_loaded:
+        if not self._state.search_loaded:
             self._load_all_for_search()
 
-        self._filtered_search_items = [
-            item for item in self._all_search_items if query in item.path.name.lower()
+        self._state.filtered_search_items = [
+            item for item in self._state.all_search_items if query in item._name_lower
         ]
 
         if getattr(self.window, "library_search_results_label", None):
-            count = len(self._filtered_search_items)
-            total = len(self._all_search_items)
+            count = len(self._state.filtered_search_items)
+            total = len(self._state.all_search_items)
             self.window.library_search_results_label.set_label(f"{count} / {total}")
 
-        self._render_library_search_results(self._filtered_search_items)
+        self._render_library_search_results(self._state.filtered_search_items)
         self.window.library_stack.set_visible_child_name("search_results")
 
         if getattr(self.window, "pagination_bar", None):
             self.window.pagination_bar.set_visible(False)
+        return GLib.SOURCE_REMOVE
 
     def _load_all_for_search(self):
-        folder = self._library_folder if self._library_folder else self.core.get_default_library_dir()
+        folder = self._state.library_folder if self._state.library_folder else self.core.get_default_library_dir()
 
         if not folder or not folder.exists():
-            self._all_search_items = []
-            self._search_loaded = True
+            self._state.all_search_items = []
+            self._state.search_loaded = True
             return
 
         try:
-            all_items = self.core.list_library(folder, recursive=True)
-            self._all_search_items = all_items
-            self._search_loaded = True
+            all_items = self._index_items(self.core.list_library(folder, recursive=True))
+            self._state.all_search_items = all_items
+            self._state.search_loaded = True
         except Exception:
-            self._all_search_items = []
-            self._search_loaded = True
+            self._state.all_search_items = []
+            self._state.search_loaded = True
 
     def _render_library_search_results(self, items):
-        if not getattr(self.window, "library_search_list", None):
+        search_list = getattr(self.window, "library_search_list", None)
+        if not search_list:
             return
 
-        while True:
-            row = self.window.library_search_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.window.library_search_list.remove(row)
+        if self._search_model is None:
+            self._search_model = Gio.ListStore.new(_SearchEntry)
+            if isinstance(search_list, Gtk.ListView):
+                # Virtualized path: a factory recycles roughly one row
+                # widget per viewport slot, so result-set size no longer
+                # dictates widget count
+                factory = Gtk.SignalListItemFactory()
+                factory.connect("setup", self._on_search_item_setup)
+                factory.connect("bind", self._on_search_item_bind)
+                search_list.set_factory(factory)
+                search_list.set_model(Gtk.SingleSelection(model=self._search_model))
+            else:
+                # ListBox fallback (programmatic UI): one row per item
+                search_list.bind_model(self._search_model, self._create_search_row)
 
-        for item in items:
-            content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-            content.set_margin_top(6)
-            content.set_margin_bottom(6)
-            content.set_margin_start(12)
-            content.set_margin_end(12)
-
-            icon_name = (
-                "video-x-generic-symbolic" if item.kind == "video" else "image-x-generic-symbolic"
+        # Single splice: one items-changed emission inside GTK instead of a
+        # remove/append (and relayout) per row.
+        search_list.set_visible(False)
+        search_list.freeze_notify()
+        try:
+            self._search_model.splice(
+                0, self._search_model.get_n_items(), [_SearchEntry(item) for item in items]
             )
-            icon = Gtk.Image.new_from_icon_name(icon_name)
-            content.append(icon)
+        finally:
+            search_list.thaw_notify()
+            search_list.set_visible(True)
+
+    def _on_search_item_setup(self, factory, list_item):
+        """Build one recycled search-row widget (one per viewport slot)."""
+        content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        content.set_margin_top(6)
+        content.set_margin_bottom(6)
+        content.set_margin_start(12)
+        content.set_margin_end(12)
+
+        icon = Gtk.Image()
+        content.append(icon)
+
+        label = Gtk.Label()
+        label.set_xalign(0)
+        label.set_hexpand(True)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        content.append(label)
+
+        # Direct references so bind never walks the child tree
+        content._icon = icon
+        content._label = label
+        list_item.set_child(content)
+
+    def _on_search_item_bind(self, factory, list_item):
+        """Point a recycled row widget at the bound item."""
+        content = list_item.get_child()
+        item = list_item.get_item().item
 
-            label = Gtk.Label(label=item.path.name)
-            label.set_xalign(0)
-            label.set_hexpand(True)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            content.append(label)
+        icon_name = (
+            VIDEO_ICON if item.kind == "video" else IMAGE_ICON
+        )
+        content._icon.set_from_paintable(self._icon_paintable(icon_name))
+        content._label.set_label(item._name)
 
-            row = Gtk.ListBoxRow()
-            row.set_child(content)
+    def _create_search_row(self, entry):
+        item = entry.item
 
-            row.media_path = item.path
-            row.media_item = item
+        content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        content.set_margin_top(6)
+        content.set_margin_bottom(6)
+        content.set_margin_start(12)
+        content.set_margin_end(12)
 
-            self.window.library_search_list.append(row)
+        icon_name = (
+            VIDEO_ICON if item.kind == "video" else IMAGE_ICON
+        )
+        content.append(self._icon_image(icon_name))
+
+        label = Gtk.Label(label=item._name)
+        label.set_xalign(0)
+        label.set_hexpand(True)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        content.append(label)
+
+        row = Gtk.ListBoxRow()
+        row.set_child(content)
+
+        row.media_path = item.path
+        row.media_item = item
+
+        return row
+
+    def _on_library_search_view_activated(self, listview, position):
+        """Activation handler for the virtualized (ListView) search list."""
+        entry = self._search_model.get_item(position) if self._search_model else None
+        if entry is None:
+            return
+
+        item = entry.item
+        self.on_item_selected(item.path)
+        self._show_library_search_preview(item.path, item)
 
     def _on_library_search_activated(self, listbox, row):
         if not hasattr(row, "media_path"):
@@ -352,7 +550,7 @@ class LibraryController:
                 self.window.library_search_preview_box.append(thumb)
             else:
                 icon_box = self._create_fallback_icon(
-                    "image-x-generic-symbolic", thumb_width, thumb_height
+                    IMAGE_ICON, thumb_width, thumb_height
                 )
                 self.window.library_search_preview_box.append(icon_box)
         elif media_item and media_item.kind == "video":
@@ -364,12 +562,12 @@ class LibraryController:
                     self.window.library_search_preview_box.append(thumb)
                 else:
                     icon_box = self._create_fallback_icon(
-                        "video-x-generic-symbolic", thumb_width, thumb_height
+                        VIDEO_ICON, thumb_width, thumb_height
                     )
                     self.window.library_search_preview_box.append(icon_box)
             else:
                 icon_box = self._create_fallback_icon(
-                    "video-x-generic-symbolic", thumb_width, thumb_height
+                    VIDEO_ICON, thumb_width, thumb_height
                 )
                 self.window.library_search_preview_box.append(icon_box)
         else:
@@ -397,7 +595,20 @@ class LibraryController:
             self.window.library_grid.append(child)
 
     def _render_grid_view(self, items):
-        self.window.library_grid.remove_all()
+        grid = self.window.library_grid
+
+        # Build the whole page with the parent hidden and notifications frozen
+        # so GTK does a single layout pass instead of one per appended child.
+        grid.set_visible(False)
+        grid.freeze_notify()
+        try:
+            self._populate_grid_view(grid, items)
+        finally:
+            grid.thaw_notify()
+            grid.set_visible(True)
+
+    def _populate_grid_view(self, grid, items):
+        grid.remove_all()
 
         if not items:
             label = Gtk.Label(label="No media files found")
@@ -408,7 +619,7 @@ class LibraryController:
             child = Gtk.FlowBoxChild()
             child.set_child(label)
             child.set_can_focus(False)
-            self.window.library_grid.append(child)
+            grid.append(child)
             return
 
         for item in items:
@@ -416,7 +627,7 @@ class LibraryController:
             child = Gtk.FlowBoxChild()
             child.set_child(card)
             child.media_path = item.path
-            self.window.library_grid.append(child)
+            grid.append(child)
 
     def _create_gallery_card(self, item):
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
@@ -436,7 +647,7 @@ class LibraryController:
                 card.append(thumb)
             else:
                 icon_box = self._create_fallback_icon(
-                    "image-x-generic-symbolic", thumb_width, thumb_height
+                    IMAGE_ICON, thumb_width, thumb_height
                 )
                 card.append(icon_box)
         else:
@@ -449,16 +660,16 @@ class LibraryController:
                     card.append(thumb)
                 else:
                     icon_box = self._create_fallback_icon(
-                        "video-x-generic-symbolic", thumb_width, thumb_height
+                        VIDEO_ICON, thumb_width, thumb_height
                     )
                     card.append(icon_box)
             else:
                 icon_box = self._create_fallback_icon(
-                    "video-x-generic-symbolic", thumb_width, thumb_height
+                    VIDEO_ICON, thumb_width, thumb_height
                 )
                 card.append(icon_box)
 
-        label = Gtk.Label(label=item.path.name)
+        label = Gtk.Label(label=item._name)
         label.set_xalign(0.5)
         label.set_ellipsize(Pango.EllipsizeMode.END)
         label.set_max_width_chars(20)
@@ -474,7 +685,7 @@ class LibraryController:
         icon_box.set_size_request(width, height)
         icon_box.add_css_class("wallpaper-thumb")
 
-        icon = Gtk.Image.new_from_icon_name(icon_name)
+        icon = self._icon_image(icon_name, pixel_size=48)
         icon.set_pixel_size(48)
         icon_box.append(icon)
 
@@ -492,7 +703,9 @@ class LibraryController:
         try:
             default_dir = self.core.get_default_library_dir()
             if default_dir and default_dir.exists() and default_dir.is_dir():
-                self._load_library(default_dir)
+                # Scan on a worker thread so startup stays responsive; the
+                # first page renders as soon as the first batch streams in
+                self._load_library(default_dir, background=True)
         except Exception:
             # Silently fail - user can manually choose folder
             pass
@@ -534,10 +747,11 @@ class LibraryController:
     def _append_library_batch(self, batch):
         """Append a batch of items to both views (called from idle_add) - LEGACY"""
         # Remove loading placeholder on first batch
-        if not self._library_items:
+        if not self._state.library_items:
             self._clear_loading_placeholder()
 
-        self._library_items.extend(batch)
+        self._index_items(batch)
+        self._state.library_items.extend(batch)
 
         # Append to list view (if exists)
         for item in batch:
@@ -555,7 +769,7 @@ class LibraryController:
         self._clear_loading_placeholder()
 
         # If no items found, show message
-        if not self._library_items:
+        if not self._state.library_items:
             self._show_no_media_message()
 
         return False  # Don't repeat
@@ -584,16 +798,12 @@ class LibraryController:
 
     def _clear_loading_placeholder(self):
         """Remove loading placeholder from gallery view - LEGACY"""
-        # Clear grid view placeholder (FlowBox) - GTK4 iteration
+        # The placeholder is only ever appended to an empty grid, so checking
+        # the first child is enough - no need to walk the whole child list.
         if getattr(self.window, 'library_grid', None):
-            from gi.repository import Gtk
             child = self.window.library_grid.get_first_child()
-            while child is not None:
-                next_child = child.get_next_sibling()
-                if isinstance(child, Gtk.FlowBoxChild) and child.get_name() == "loading-placeholder":
-                    self.window.library_grid.remove(child)
-                    break  # Only one placeholder
-                child = next_child
+            if child is not None and child.get_name() == "loading-placeholder":
+                self.window.library_grid.remove(child)
 
     def _append_to_list_view(self, item):
         """Append a single item to list view (for progressive loading) - LEGACY"""
@@ -611,9 +821,8 @@ class LibraryController:
         content.set_margin_end(12)
 
         # Icon based on kind
-        icon_name = "video-x-generic-symbolic" if item.kind == "video" else "image-x-generic-symbolic"
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        content.append(icon)
+        icon_name = VIDEO_ICON if item.kind == "video" else IMAGE_ICON
+        content.append(self._icon_image(icon_name))
 
         # Filename
         label = Gtk.Label(label=item.path.name)
@@ -12,27 +12,68 @@ except (ImportError, ValueError) as e:
     raise RuntimeError("GTK4 not available") from e
 
 
-def _make_picture_from_file(file_path: Path, width: int, height: int, cover: bool = True) -> Gtk.Picture | None:
+def _load_pixbuf_scaled(file_path: Path, width: int, height: int) -> GdkPixbuf.Pixbuf | None:
     """
-    Create a Gtk.Picture from an image file with proper scaling.
-    Returns None on failure.
+    Decode an image at the target size (scale-on-load fast path).
+    Safe to call from worker threads. Returns None on failure.
+
+    For sources at least twice the target, the image is decoded at the
+    largest power-of-two reduction that still covers the target (probed via
+    get_file_info, which reads only the header) and then downscaled once.
+    Power-of-two targets hit libjpeg-turbo's 1/2 / 1/4 / 1/8 DCT-scale path,
+    which skips most of the inverse transform for multi-megapixel files.
     """
+    path_str = str(file_path)
     try:
-        pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-            str(file_path),
+        _fmt, src_w, src_h = GdkPixbuf.Pixbuf.get_file_info(path_str)
+        if _fmt is not None and src_w >= 2 * width and src_h >= 2 * height:
+            k = 1
+            while k < 3 and (src_w >> (k + 1)) >= width and (src_h >> (k + 1)) >= height:
+                k += 1
+            intermediate = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                path_str,
+                width=src_w >> k,
+                height=src_h >> k,
+                preserve_aspect_ratio=True
+            )
+            # Final fit matches new_from_file_at_scale's aspect-preserving box
+            scale = min(width / src_w, height / src_h)
+            return intermediate.scale_simple(
+                max(1, round(src_w * scale)),
+                max(1, round(src_h * scale)),
+                GdkPixbuf.InterpType.BILINEAR,
+            )
+
+        return GdkPixbuf.Pixbuf.new_from_file_at_scale(
+            path_str,
             width=width,
             height=height,
             preserve_aspect_ratio=True
         )
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-        picture = Gtk.Picture.new_for_paintable(texture)
+    except Exception:
+        return None
 
-        if cover:
-            picture.set_content_fit(Gtk.ContentFit.COVER)
-        else:
-            picture.set_content_fit(Gtk.ContentFit.CONTAIN)
 
-        picture.set_can_shrink(True)
-        return picture
-    except Exception:
-        return None
\ No newline at end of file
+def _make_picture_from_pixbuf(pixbuf: GdkPixbuf.Pixbuf, cover: bool = True) -> Gtk.Picture:
+    """Wrap an already-decoded pixbuf in a Gtk.Picture (main thread only)"""
+    texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+    picture = Gtk.Picture.new_for_paintable(texture)
+
+    if cover:
+        picture.set_content_fit(Gtk.ContentFit.COVER)
+    else:
+        picture.set_content_fit(Gtk.ContentFit.CONTAIN)
+
+    picture.set_can_shrink(True)
+    return picture
+
+
+def _make_picture_from_file(file_path: Path, width: int, height: int, cover: bool = True) -> Gtk.Picture | None:
+    """
+    Create a Gtk.Picture from an image file with proper scaling.
+    Returns None on failure.
+    """
+    pixbuf = _load_pixbuf_scaled(file_path, width, height)
+    if pixbuf is None:
+        return None
+    return _make_picture_from_pixbuf(pixbuf, cover=cover)
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""In-memory LRU cache for decoded thumbnail pixbufs.
+
+Re-selecting the same file (or re-opening a preview) used to redecode the
+thumbnail from disk every time. Cached pixbufs are keyed by path, mtime and
+target size, so edits to the file invalidate the entry automatically.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+_MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_cache: OrderedDict = OrderedDict()
+
+
+def make_key(path: Path, width: int, height: int) -> tuple:
+    """Build a cache key for a file at a target thumbnail size"""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    return (str(path), mtime_ns, width, height)
+
+
+def get(key: tuple):
+    """Return the cached pixbuf for key, or None (refreshes LRU position)"""
+    with _lock:
+        pixbuf = _cache.get(key)
+        if pixbuf is not None:
+            _cache.move_to_end(key)
+        return pixbuf
+
+
+def put(key: tuple, pixbuf) -> None:
+    """Store a decoded pixbuf, evicting the least recently used entry if full"""
+    with _lock:
+        _cache[key] = pixbuf
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
@@ -0,0 +1,28 @@
+"""Bounded concurrency for video thumbnail generation.
+
+ffmpeg already runs as a separate process and the subprocess wait releases
+the GIL, so the window's existing worker threads are enough to parallelize
+the Python side; the shared semaphore here caps in-flight ffmpeg jobs so a
+bulk selection cannot spawn an unbounded number of concurrent processes.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+from hyprwall.gui.utils.thumbnails import _ensure_video_thumb
+
+_MAX_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Blocks callers once the slots are full, so a submission burst applies
+# backpressure instead of piling up concurrent ffmpeg processes
+_SLOTS = threading.Semaphore(_MAX_JOBS)
+
+
+def generate_video_thumb(path: Path, width: int, height: int) -> Path | None:
+    """Generate a video thumbnail, bounded by the shared job slots (blocking).
+
+    Intended for callers already running on a worker thread.
+    """
+    with _SLOTS:
+        return _ensure_video_thumb(path, width, height)
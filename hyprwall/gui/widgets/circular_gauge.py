@@ -11,11 +11,14 @@ import math
 try:
     import gi
     gi.require_version('Gtk', '4.0')
-    from gi.repository import Gtk, GLib
+    from gi.repository import Gtk, GLib, Pango, PangoCairo
     GTK_AVAILABLE = True
 except (ImportError, ValueError):
     GTK_AVAILABLE = False
 
+# Arc starts at the top, clockwise
+_START_ANGLE = -math.pi / 2
+
 
 class CircularGauge(Gtk.DrawingArea):
     """
@@ -58,6 +61,20 @@ class CircularGauge(Gtk.DrawingArea):
         self._value: Optional[float] = None
         self._label: Optional[str] = None
 
+        # Draw-path caches: geometry only changes with widget size, and the
+        # arc's end angle only changes with the value.
+        self._cached_dims: tuple[int, int] = (0, 0)
+        self._cached_geom: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+        self._end_angle: Optional[float] = None
+
+        # Cached Pango layout: reuses shaped glyph runs across draws instead of
+        # re-shaping via Cairo's toy text API every frame. Text and font size
+        # are only pushed into the layout when they actually change.
+        self._layout = Pango.Layout.new(self.get_pango_context())
+        self._font_desc = Pango.FontDescription("Sans Bold")
+        self._last_text: Optional[str] = None
+        self._last_font_size: float = -1.0
+
         # Configure drawing area
         self.set_size_request(size, size)
         self.set_draw_func(self._on_draw)
@@ -73,10 +90,48 @@ class CircularGauge(Gtk.DrawingArea):
             value: New value (None shows "N/A")
             label: Optional label to show in center (e.g., "24%", "180 MiB")
         """
+        # Polling loops often report the same reading; skip the redraw entirely
+        if value == self._value and label == self._label:
+            return
+
         self._value = value
         self._label = label
+        self._update_end_angle()
+
         self.queue_draw()  # Request redraw
 
+    def set_range(self, min_value: Optional[float] = None, max_value: Optional[float] = None):
+        """
+        Update the gauge range, re-normalizing the current value.
+
+        Args:
+            min_value: New minimum (keep current if None)
+            max_value: New maximum (keep current if None)
+        """
+        if min_value is None:
+            min_value = self._min_value
+        if max_value is None:
+            max_value = self._max_value
+        if min_value == self._min_value and max_value == self._max_value:
+            return
+
+        self._min_value = min_value
+        self._max_value = max_value
+        # The cached arc depends on the range too, so a range change must
+        # redraw even when the value itself hasn't moved
+        self._update_end_angle()
+        self.queue_draw()
+
+    def _update_end_angle(self):
+        """Recompute the cached arc end angle from value and range"""
+        if self._value is not None:
+            # Normalize value to 0-1 range, clamped
+            normalized = (self._value - self._min_value) / (self._max_value - self._min_value)
+            normalized = max(0.0, min(1.0, normalized))
+            self._end_angle = _START_ANGLE + (2 * math.pi * normalized)
+        else:
+            self._end_angle = None
+
     def _on_draw(self, area, cr, width, height):
         """
         Draw the circular gauge using Cairo.
@@ -87,10 +142,16 @@ class CircularGauge(Gtk.DrawingArea):
             width: Widget width
             height: Widget height
         """
-        # Center and radius
-        cx = width / 2
-        cy = height / 2
-        radius = min(width, height) / 2 - 6  # 6px margin
+        # Geometry only depends on widget size; recompute on resize only
+        if (width, height) != self._cached_dims:
+            cx = width / 2
+            cy = height / 2
+            radius = min(width, height) / 2 - 6  # 6px margin
+            font_size = radius / 2.5
+            self._cached_dims = (width, height)
+            self._cached_geom = (cx, cy, radius, font_size)
+        else:
+            cx, cy, radius, font_size = self._cached_geom
 
         # Background circle (track)
         cr.set_line_width(6)
@@ -98,21 +159,11 @@ class CircularGauge(Gtk.DrawingArea):
         cr.arc(cx, cy, radius, 0, 2 * math.pi)
         cr.stroke()
 
-        # Progress arc (if value available)
-        if self._value is not None:
-            # Normalize value to 0-1 range
-            normalized = (self._value - self._min_value) / (self._max_value - self._min_value)
-            normalized = max(0.0, min(1.0, normalized))  # Clamp to [0, 1]
-
-            # Arc angle (starts at top, clockwise)
-            start_angle = -math.pi / 2  # Top
-            end_angle = start_angle + (2 * math.pi * normalized)
-
-            # Draw progress arc
-            cr.set_line_width(6)
+        # Progress arc (end angle precomputed in set_value)
+        if self._end_angle is not None:
             cr.set_line_cap(1)  # Round cap
             cr.set_source_rgba(*self._color)
-            cr.arc(cx, cy, radius, start_angle, end_angle)
+            cr.arc(cx, cy, radius, _START_ANGLE, self._end_angle)
             cr.stroke()
 
         # Center text
@@ -123,21 +174,20 @@ class CircularGauge(Gtk.DrawingArea):
         else:
             text = "N/A"
 
-        # Draw text
-        cr.set_source_rgba(1.0, 1.0, 1.0, 0.9)  # White text
-        cr.select_font_face("Sans", 0, 1)  # Normal weight, bold
-
-        # Font size based on widget size
-        font_size = radius / 2.5
-        cr.set_font_size(font_size)
+        # Draw text via the cached Pango layout
+        if font_size != self._last_font_size:
+            self._font_desc.set_absolute_size(font_size * Pango.SCALE)
+            self._layout.set_font_description(self._font_desc)
+            self._last_font_size = font_size
+        if text != self._last_text:
+            self._layout.set_text(text, -1)
+            self._last_text = text
 
-        # Center text
-        extents = cr.text_extents(text)
-        text_x = cx - extents.width / 2 - extents.x_bearing
-        text_y = cy - extents.height / 2 - extents.y_bearing
+        text_width, text_height = self._layout.get_pixel_size()
 
-        cr.move_to(text_x, text_y)
-        cr.show_text(text)
+        cr.set_source_rgba(1.0, 1.0, 1.0, 0.9)  # White text
+        cr.move_to(cx - text_width / 2, cy - text_height / 2)
+        PangoCairo.show_layout(cr, self._layout)
 
     def _parse_color(self, color_str: str) -> tuple[float, float, float, float]:
         """
@@ -5,7 +5,9 @@ Modern, lightweight performance HUD for HyprWall wallpaper monitoring.
 """
 
 from __future__ import annotations
+from collections import deque, namedtuple
 from typing import Optional
+import threading
 
 try:
     import gi
@@ -16,6 +18,11 @@ except (ImportError, ValueError):
     GTK_AVAILABLE = False
 
 from hyprwall.perf.monitor import WallpaperPerfMonitor
+
+# Sentinel distinct from None (None is a real "N/A" display state)
+_UNSET = object()
+
+_MetricBox = namedtuple("_MetricBox", "container gauge sparkline")
 from hyprwall.gui.widgets.circular_gauge import CircularGauge
 from hyprwall.gui.widgets.sparkline import Sparkline
 
@@ -33,9 +40,9 @@ class PerformancePanel(Gtk.Box):
 
     Design:
     - Non-intrusive, battery-friendly
-    - 1 Hz update rate (respects monitor rate limiting)
-    - No background threads
-    - Uses GTK main loop timer
+    - Adaptive 1-10s update rate (backs off while metrics are stable)
+    - Sampling runs on a daemon worker thread so /proc and GPU reads can
+      never stall the GTK main loop; only cheap widget updates run on it
     """
 
     def __init__(self):
@@ -57,13 +64,44 @@ class PerformancePanel(Gtk.Box):
 
         # State
         self._current_pid: Optional[int] = None
-        self._refresh_timer: Optional[int] = None
 
-        # History buffers (extended for sparklines)
-        self._cpu_history: list[float] = []
-        self._ram_history: list[float] = []
-        self._gpu_history: list[float] = []
+        # Sampling worker: the thread sleeps on this event so stop is
+        # immediate, and stale idle callbacks carry the event to identify
+        # themselves as cancelled
+        self._worker: Optional[threading.Thread] = None
+        self._worker_stop: Optional[threading.Event] = None
+
+        # Mapped-state flag mirrored from the map/unmap signals so the worker
+        # thread can skip sampling while the panel is hidden without touching
+        # GTK from off the main thread
+        self._is_mapped = False
+        self.connect("map", self._on_mapped)
+        self.connect("unmap", self._on_unmapped)
+
+        # Adaptive polling: back off from 1s up to 10s while readings are
+        # stable, snap back to 1s on any meaningful change (fewer wakeups on
+        # idle wallpapers)
+        self._interval_ms = 1000
+        self._stable_count = 0
+        self._last_sample: Optional[tuple] = None
+
+        # Last displayed values and rendered strings: skip formatting when the
+        # reading is identical, and skip the widget update (each set
+        # invalidates the Pango layout) when the text at display precision is
+        # identical too
+        self._last_cpu_val = _UNSET
+        self._last_ram_val = _UNSET
+        self._last_gpu_val = _UNSET
+        self._last_cpu_txt: Optional[str] = None
+        self._last_ram_txt: Optional[str] = None
+        self._last_gpu_txt: Optional[str] = None
+
+        # History buffers (extended for sparklines). Bounded deques: append is
+        # O(1) with automatic head eviction, unlike list.append + pop(0).
         self._max_history = 30  # 30 seconds of data at 1 Hz
+        self._cpu_history: deque[float] = deque(maxlen=self._max_history)
+        self._ram_history: deque[float] = deque(maxlen=self._max_history)
+        self._gpu_history: deque[float] = deque(maxlen=self._max_history)
 
         # Build UI
         self._build_ui()
@@ -85,21 +123,21 @@ class PerformancePanel(Gtk.Box):
 
         # CPU gauge + sparkline
         cpu_box = self._create_metric_box("CPU", "#3584e4")
-        self._cpu_gauge = cpu_box["gauge"]
-        self._cpu_sparkline = cpu_box["sparkline"]
-        gauges_grid.attach(cpu_box["container"], 0, 0, 1, 1)
+        self._cpu_gauge = cpu_box.gauge
+        self._cpu_sparkline = cpu_box.sparkline
+        gauges_grid.attach(cpu_box.container, 0, 0, 1, 1)
 
         # RAM gauge + sparkline
         ram_box = self._create_metric_box("RAM", "#33d17a")
-        self._ram_gauge = ram_box["gauge"]
-        self._ram_sparkline = ram_box["sparkline"]
-        gauges_grid.attach(ram_box["container"], 1, 0, 1, 1)
+        self._ram_gauge = ram_box.gauge
+        self._ram_sparkline = ram_box.sparkline
+        gauges_grid.attach(ram_box.container, 1, 0, 1, 1)
 
         # GPU gauge + sparkline
         gpu_box = self._create_metric_box("GPU", "#f66151")
-        self._gpu_gauge = gpu_box["gauge"]
-        self._gpu_sparkline = gpu_box["sparkline"]
-        gauges_grid.attach(gpu_box["container"], 2, 0, 1, 1)
+        self._gpu_gauge = gpu_box.gauge
+        self._gpu_sparkline = gpu_box.sparkline
+        gauges_grid.attach(gpu_box.container, 2, 0, 1, 1)
 
         # Secondary metrics (smaller)
         secondary_grid = Gtk.Grid()
@@ -123,7 +161,7 @@ class PerformancePanel(Gtk.Box):
         info.set_margin_top(8)
         self.append(info)
 
-    def _create_metric_box(self, name: str, color: str) -> dict:
+    def _create_metric_box(self, name: str, color: str) -> _MetricBox:
         """
         Create a metric box with gauge + sparkline.
 
@@ -132,7 +170,7 @@ class PerformancePanel(Gtk.Box):
             color: Hex color for gauge/sparkline
 
         Returns:
-            Dict with 'container', 'gauge', 'sparkline' widgets
+            _MetricBox with container, gauge and sparkline widgets
         """
         container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         container.add_css_class("metric-box")
@@ -153,11 +191,7 @@ class PerformancePanel(Gtk.Box):
         sparkline.set_halign(Gtk.Align.CENTER)
         container.append(sparkline)
 
-        return {
-            "container": container,
-            "gauge": gauge,
-            "sparkline": sparkline,
-        }
+        return _MetricBox(container=container, gauge=gauge, sparkline=sparkline)
 
     def _create_secondary_metric(self, name: str, value: str) -> Gtk.Box:
         """Create a secondary metric (label-based)"""
@@ -178,8 +212,23 @@ class PerformancePanel(Gtk.Box):
         value_label.set_name(f"{name.lower().replace(' ', '_')}_value")
         box.append(value_label)
 
+        # Keep a direct reference so updates don't have to walk the children,
+        # plus the last set string so no-op updates can be skipped
+        box._value_label = value_label
+        box._last_value = value
+
         return box
 
+    def update_pid_if_changed(self, pid: Optional[int]):
+        """
+        Set the monitored PID only if it differs from the current one.
+
+        Periodic refresh ticks call this; an unchanged PID leaves the
+        sampling worker and its histories untouched.
+        """
+        if pid != self._current_pid:
+            self.set_pid(pid)
+
     def set_pid(self, pid: Optional[int]):
         """
         Set the PID to monitor.
@@ -200,23 +249,39 @@ class PerformancePanel(Gtk.Box):
             self.start_monitoring()
 
     def start_monitoring(self):
-        """Start auto-refresh timer"""
-        if self._refresh_timer is not None:
+        """Start the background sampling worker"""
+        if self._worker is not None and self._worker.is_alive():
             return  # Already running
 
-        # Refresh every 1 second (respects monitor rate limiting)
-        self._refresh_timer = GLib.timeout_add_seconds(1, self._refresh_metrics)
+        self._interval_ms = 1000
+        self._stable_count = 0
+        self._last_sample = None
 
-        # Immediate first refresh
-        self._refresh_metrics()
+        stop = threading.Event()
+        self._worker_stop = stop
+        self._worker = threading.Thread(
+            target=self._metrics_worker,
+            args=(stop,),
+            daemon=True,
+        )
+        self._worker.start()
 
     def stop_monitoring(self):
-        """Stop auto-refresh timer"""
-        if self._refresh_timer is not None:
-            GLib.source_remove(self._refresh_timer)
-            self._refresh_timer = None
-
-        # Reset all widgets
+        """Stop the background sampling worker"""
+        if self._worker_stop is not None:
+            # Wakes the worker immediately; it is a daemon thread and any
+            # already-posted idle callback checks the event before touching UI
+            self._worker_stop.set()
+            self._worker_stop = None
+        self._worker = None
+
+        # Reset all widgets (and the displayed-value caches with them)
+        self._last_cpu_val = _UNSET
+        self._last_ram_val = _UNSET
+        self._last_gpu_val = _UNSET
+        self._last_cpu_txt = None
+        self._last_ram_txt = None
+        self._last_gpu_txt = None
         self._cpu_gauge.set_value(None)
         self._ram_gauge.set_value(None)
         self._gpu_gauge.set_value(None)
@@ -228,27 +293,54 @@ class PerformancePanel(Gtk.Box):
         self._set_secondary_value(self._cpu_temp_label, "—")
         self._set_secondary_value(self._gpu_temp_label, "—")
 
-    def _refresh_metrics(self) -> bool:
+    def _on_mapped(self, *_args):
+        self._is_mapped = True
+
+    def _on_unmapped(self, *_args):
+        self._is_mapped = False
+
+    def _metrics_worker(self, stop: threading.Event):
         """
-        Refresh metrics display (timer callback).
+        Worker thread: samples metrics and posts results to the main loop.
 
-        Returns:
-            True to continue timer, False to stop
+        All /proc and GPU reads happen here; the main thread only receives
+        ready PerfMetrics snapshots via idle_add. Sleeps on the stop event at
+        the adaptive interval maintained by _adapt_interval, and skips
+        sampling while the panel is hidden so resuming is instant but a
+        hidden panel costs nothing.
         """
-        if self._current_pid is None:
-            return False  # Stop timer
+        while not stop.is_set():
+            pid = self._current_pid
+            if pid is None:
+                break
 
-        # Get metrics from monitor (rate-limited to 1 Hz)
-        metrics = self._monitor.get_metrics(self._current_pid)
+            if self._is_mapped:
+                metrics = self._monitor.get_metrics(pid)
+                if stop.is_set():
+                    break
+                GLib.idle_add(self._apply_metrics, metrics, stop)
+
+            if stop.wait(self._interval_ms / 1000.0):
+                break
+
+    def _apply_metrics(self, metrics, stop: threading.Event) -> bool:
+        """Apply a sampled metrics snapshot to the widgets (main thread)"""
+        if stop.is_set() or self._current_pid is None:
+            return False
 
         # Update CPU
         if metrics.cpu_percent is not None:
-            self._cpu_gauge.set_value(metrics.cpu_percent, f"{metrics.cpu_percent:.1f}%")
+            if metrics.cpu_percent != self._last_cpu_val:
+                self._last_cpu_val = metrics.cpu_percent
+                txt = format(metrics.cpu_percent, ".1f") + "%"
+                if txt != self._last_cpu_txt:
+                    self._last_cpu_txt = txt
+                    self._cpu_gauge.set_value(metrics.cpu_percent, txt)
             self._cpu_history.append(metrics.cpu_percent)
-            if len(self._cpu_history) > self._max_history:
-                self._cpu_history.pop(0)
             self._cpu_sparkline.set_data(self._cpu_history, min_value=0, max_value=100)
-        else:
+        elif self._last_cpu_val is not None:
+            self._last_cpu_val = None
+            self._last_cpu_txt = "N/A"
             self._cpu_gauge.set_value(None, "N/A")
 
         # Update RAM (normalize to MiB, gauge shows 0-2048 MiB range)
@@ -262,24 +354,37 @@ class PerformancePanel(Gtk.Box):
             else:
                 max_ram = 256
 
-            self._ram_gauge.set_value(metrics.ram_mib, f"{metrics.ram_mib:.0f}M")
-            self._ram_gauge._max_value = max_ram  # Dynamic range
+            # Range first: set_value caches the arc against the current
+            # range, and set_range re-normalizes if only the range moved
+            self._ram_gauge.set_range(max_value=max_ram)
+
+            if metrics.ram_mib != self._last_ram_val:
+                self._last_ram_val = metrics.ram_mib
+                txt = format(metrics.ram_mib, ".0f") + "M"
+                if txt != self._last_ram_txt:
+                    self._last_ram_txt = txt
+                    self._ram_gauge.set_value(metrics.ram_mib, txt)
 
             self._ram_history.append(metrics.ram_mib)
-            if len(self._ram_history) > self._max_history:
-                self._ram_history.pop(0)
             self._ram_sparkline.set_data(self._ram_history, min_value=0)
-        else:
+        elif self._last_ram_val is not None:
+            self._last_ram_val = None
+            self._last_ram_txt = "N/A"
             self._ram_gauge.set_value(None, "N/A")
 
         # Update GPU
         if metrics.gpu_percent is not None:
-            self._gpu_gauge.set_value(metrics.gpu_percent, f"{metrics.gpu_percent:.1f}%")
+            if metrics.gpu_percent != self._last_gpu_val:
+                self._last_gpu_val = metrics.gpu_percent
+                txt = format(metrics.gpu_percent, ".1f") + "%"
+                if txt != self._last_gpu_txt:
+                    self._last_gpu_txt = txt
+                    self._gpu_gauge.set_value(metrics.gpu_percent, txt)
             self._gpu_history.append(metrics.gpu_percent)
-            if len(self._gpu_history) > self._max_history:
-                self._gpu_history.pop(0)
             self._gpu_sparkline.set_data(self._gpu_history, min_value=0, max_value=100)
-        else:
+        elif self._last_gpu_val is not None:
+            self._last_gpu_val = None
+            self._last_gpu_txt = "N/A"
             self._gpu_gauge.set_value(None, "N/A")
 
         # FPS and Power removed - not reliable in all environments
@@ -295,13 +400,36 @@ class PerformancePanel(Gtk.Box):
         else:
             self._set_secondary_value(self._gpu_temp_label, "N/A")
 
-        return True  # Continue timer
+        self._adapt_interval(metrics)
+        return False  # One-shot idle callback
+
+    def _adapt_interval(self, metrics):
+        """Adjust the polling interval based on sample stability"""
+        sample = (metrics.cpu_percent, metrics.ram_mib, metrics.gpu_percent)
+
+        stable = self._last_sample is not None and all(
+            (old is None and new is None)
+            or (old is not None and new is not None and abs(new - old) < 0.5)
+            for old, new in zip(self._last_sample, sample)
+        )
+        self._last_sample = sample
+
+        if stable:
+            self._stable_count += 1
+        else:
+            self._stable_count = 0
+
+        # The worker reads _interval_ms on its next wait, so updating the
+        # attribute is all that's needed to change cadence
+        if not stable:
+            self._interval_ms = 1000
+        elif self._stable_count >= 3 and self._interval_ms < 10000:
+            self._interval_ms = min(self._interval_ms * 2, 10000)
+            self._stable_count = 0
 
     def _set_secondary_value(self, metric_box: Gtk.Box, value: str):
-        """Update value label in a secondary metric box"""
-        child = metric_box.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Label) and "title-3" in child.get_css_classes():
-                child.set_label(value)
-                return
-            child = child.get_next_sibling()
\ No newline at end of file
+        """Update value label in a secondary metric box (skips no-op sets)"""
+        if metric_box._last_value == value:
+            return
+        metric_box._last_value = value
+        metric_box._value_label.set_label(value)
\ No newline at end of file
@@ -5,7 +5,11 @@ Minimal line chart for showing historical trends in performance metrics.
 """
 
 from __future__ import annotations
-from typing import Optional
+from array import array
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Sequence
+import math
 
 try:
     import gi
@@ -15,6 +19,59 @@ try:
 except (ImportError, ValueError):
     GTK_AVAILABLE = False
 
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized path geometry when available
+    np = None
+
+_TAU = 2 * math.pi
+_PADDING = 2
+
+# Known panel palette, parsed once at import so construction skips the
+# general hex parser for the common colors
+_PALETTE = {
+    c: (int(c[1:3], 16) / 255, int(c[3:5], 16) / 255, int(c[5:7], 16) / 255, 0.9)
+    for c in ("#3584e4", "#33d17a", "#f66151")
+}
+
+
+def _bucket_mean(values: Sequence[float], target: int) -> list[float]:
+    """Downsample values to target points using per-bucket means"""
+    n = len(values)
+    bucket = n / target
+    out = []
+    start = 0.0
+    for _ in range(target):
+        end = start + bucket
+        lo = int(start)
+        hi = max(int(end), lo + 1)
+        segment = values[lo:hi]
+        out.append(sum(segment) / len(segment))
+        start = end
+    return out
+
+
+@lru_cache(maxsize=64)
+def _parse_color_cached(color_str: str) -> tuple[float, float, float, float]:
+    """Parse hex color to RGBA tuple (memoized across all sparklines)"""
+    hit = _PALETTE.get(color_str)
+    if hit is not None:
+        return hit
+
+    try:
+        color_str = color_str.lstrip("#")
+
+        if len(color_str) == 6:
+            r = int(color_str[0:2], 16) / 255
+            g = int(color_str[2:4], 16) / 255
+            b = int(color_str[4:6], 16) / 255
+            return (r, g, b, 0.9)
+
+        return (0.21, 0.52, 0.89, 0.9)  # Fallback blue
+
+    except ValueError:
+        return (0.21, 0.52, 0.89, 0.9)  # Fallback blue
+
 
 class Sparkline(Gtk.DrawingArea):
     """
@@ -53,10 +110,29 @@ class Sparkline(Gtk.DrawingArea):
         self._color = self._parse_color(color)
         self._max_points = max_points
 
-        self._values: list[float] = []
+        # Unboxed 4-byte floats instead of a list of PyFloat objects; NumPy
+        # can also view the buffer zero-copy via frombuffer
+        self._values: array = array("f")
         self._min_value = 0.0
         self._max_value = 100.0
 
+        # Chart geometry cache, recomputed only when the widget size changes
+        self._geom_dims: tuple[int, int] = (0, 0)
+        self._geom: tuple[float, float] = (0.0, 0.0)
+
+        # Downsampled view of _values when there are more samples than pixels;
+        # invalidated whenever the data or chart width changes
+        self._downsampled: Optional[list[float]] = None
+        self._downsample_width = 0
+
+        # Cached auto-range extremes: a new sample can only push a bound
+        # outward, so a full O(n) rescan is needed only once the cached
+        # extreme may have rolled out of the window
+        self._auto_min: Optional[float] = None
+        self._auto_min_age = 0
+        self._auto_max: Optional[float] = None
+        self._auto_max_age = 0
+
         # Configure drawing area
         self.set_size_request(width, height)
         self.set_draw_func(self._on_draw)
@@ -66,7 +142,7 @@ class Sparkline(Gtk.DrawingArea):
 
     def set_data(
         self,
-        values: list[float],
+        values: Sequence[float],
         min_value: Optional[float] = None,
         max_value: Optional[float] = None,
     ):
@@ -74,32 +150,79 @@ class Sparkline(Gtk.DrawingArea):
         Update sparkline data.
 
         Args:
-            values: List of values to plot
+            values: Values to plot (any sized sequence, e.g. list or deque)
             min_value: Minimum Y value (auto-detected if None)
             max_value: Maximum Y value (auto-detected if None)
         """
-        # Limit to max_points
-        if len(values) > self._max_points:
-            self._values = values[-self._max_points:]
+        # Coalesce redraws: a flat series (idle wallpaper) produces the same
+        # picture every tick. Compare against the stored snapshot *before*
+        # copying, so the steady state allocates nothing - the caller's
+        # bounded buffer is only snapshotted when it actually changed.
+        # Compare the full series; an equal tail alone can hide a shifted
+        # buffer.
+        num_new = len(values)
+        if (
+            num_new == len(self._values)
+            and num_new > 0
+            and all(abs(a - b) < 0.05 for a, b in zip(values, self._values))
+        ):
+            return
+
+        # Snapshot into a compact float array, limited to max_points. The
+        # array constructor fills unboxed C floats in one pass; non-sliceable
+        # containers (the panel's deques) stream their tail through islice.
+        if num_new <= self._max_points:
+            self._values = array("f", values)
         else:
-            self._values = values.copy()
+            start = num_new - self._max_points
+            if isinstance(values, (list, tuple)):
+                self._values = array("f", values[start:])
+            else:
+                self._values = array("f", islice(values, start, num_new))
+        self._downsampled = None
 
-        # Auto-detect range if not provided
+        # Auto-detect range if not provided, maintaining the cached extremes
+        # incrementally instead of scanning the series every update
         if self._values:
-            if min_value is None:
-                self._min_value = min(self._values)
-            else:
-                self._min_value = min_value
+            tail = self._values[-1]
 
-            if max_value is None:
-                self._max_value = max(self._values)
+            if min_value is not None:
+                self._min_value = min_value
+                self._auto_min = None
             else:
+                if self._auto_min is None or self._auto_min_age >= self._max_points:
+                    self._auto_min = min(self._values)
+                    self._auto_min_age = 0
+                elif tail <= self._auto_min:
+                    self._auto_min = tail
+                    self._auto_min_age = 0
+                else:
+                    self._auto_min_age += 1
+                self._min_value = self._auto_min
+
+            if max_value is not None:
                 self._max_value = max_value
+                self._auto_max = None
+            else:
+                if self._auto_max is None or self._auto_max_age >= self._max_points:
+                    self._auto_max = max(self._values)
+                    self._auto_max_age = 0
+                elif tail >= self._auto_max:
+                    self._auto_max = tail
+                    self._auto_max_age = 0
+                else:
+                    self._auto_max_age += 1
+                self._max_value = self._auto_max
 
             # Avoid zero range
             if abs(self._max_value - self._min_value) < 0.1:
                 self._max_value = self._min_value + 10
 
+        # No repaint needed while unmapped (GTK draws freshly when the widget
+        # is mapped again anyway)
+        if not self.get_mapped():
+            return
+
         self.queue_draw()
 
     def _on_draw(self, area, cr, width, height):
@@ -115,10 +238,22 @@ class Sparkline(Gtk.DrawingArea):
         if not self._values or len(self._values) < 2:
             return  # Need at least 2 points
 
-        # Padding
-        padding = 2
-        chart_width = width - 2 * padding
-        chart_height = height - 2 * padding
+        # Padding and chart bounds (cached per widget size)
+        padding = _PADDING
+        if (width, height) != self._geom_dims:
+            self._geom_dims = (width, height)
+            self._geom = (width - 2 * padding, height - 2 * padding)
+        chart_width, chart_height = self._geom
+
+        # More samples than horizontal pixels renders sub-pixel segments;
+        # bucket-mean down to the chart width (cached until data changes)
+        values = self._values
+        if len(values) > chart_width > 0:
+            target = int(chart_width)
+            if self._downsampled is None or self._downsample_width != target:
+                self._downsampled = _bucket_mean(values, target)
+                self._downsample_width = target
+            values = self._downsampled
 
         # Background (subtle)
         cr.set_source_rgba(0.5, 0.5, 0.5, 0.05)
@@ -126,9 +261,39 @@ class Sparkline(Gtk.DrawingArea):
         cr.fill()
 
         # Compute X spacing
-        num_points = len(self._values)
+        num_points = len(values)
         x_step = chart_width / (num_points - 1) if num_points > 1 else 0
 
+        # Normalize once: each point's geometry is computed a single time and
+        # reused for both the polyline and the dots
+        value_range = self._max_value - self._min_value
+        min_value = self._min_value
+        if np is not None:
+            # Vectorized: normalization runs at C speed, one expression per axis
+            xs = padding + np.arange(num_points, dtype=np.float32) * x_step
+            if value_range > 0:
+                # Zero-copy view when values is still the float array
+                if isinstance(values, array):
+                    vals = np.frombuffer(values, dtype=np.float32)
+                else:
+                    vals = np.asarray(values, dtype=np.float32)
+                ys = padding + chart_height * (1.0 - (vals - min_value) / value_range)
+            else:
+                ys = np.full(num_points, padding + chart_height * 0.5, dtype=np.float32)
+            pts = list(zip(xs.tolist(), ys.tolist()))
+        elif value_range > 0:
+            inv_range = 1.0 / value_range
+            pts = [
+                (
+                    padding + i * x_step,
+                    padding + chart_height * (1 - (value - min_value) * inv_range),
+                )
+                for i, value in enumerate(values)
+            ]
+        else:
+            y_mid = padding + chart_height * 0.5
+            pts = [(padding + i * x_step, y_mid) for i in range(num_points)]
+
         # Start path
         cr.set_line_width(1.5)
         cr.set_line_join(1)  # Round joins
@@ -136,58 +301,28 @@ class Sparkline(Gtk.DrawingArea):
         cr.set_source_rgba(*self._color)
 
         # Draw line
-        for i, value in enumerate(self._values):
-            # Normalize value to chart height
-            value_range = self._max_value - self._min_value
-            if value_range > 0:
-                normalized = (value - self._min_value) / value_range
-            else:
-                normalized = 0.5
-
-            # Y coordinate (inverted, 0 at top)
-            x = padding + i * x_step
-            y = padding + chart_height * (1 - normalized)
-
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
+        cr.move_to(*pts[0])
+        for x, y in pts[1:]:
+            cr.line_to(x, y)
 
         cr.stroke()
 
-        # Optional: draw dots at each point for clarity
+        # Optional: draw dots at each point for clarity. One sub-path per dot,
+        # single fill at the end - a fill() per dot flushes the path each time.
         if num_points <= 15:  # Only for small datasets
-            cr.set_source_rgba(*self._color)
-            for i, value in enumerate(self._values):
-                value_range = self._max_value - self._min_value
-                if value_range > 0:
-                    normalized = (value - self._min_value) / value_range
-                else:
-                    normalized = 0.5
-
-                x = padding + i * x_step
-                y = padding + chart_height * (1 - normalized)
-
-                cr.arc(x, y, 1.5, 0, 2 * 3.14159)
-                cr.fill()
+            for x, y in pts:
+                cr.new_sub_path()
+                cr.arc(x, y, 1.5, 0, _TAU)
+            cr.fill()
 
     def _parse_color(self, color_str: str) -> tuple[float, float, float, float]:
         """Parse hex color to RGBA tuple"""
-        try:
-            color_str = color_str.lstrip("#")
-
-            if len(color_str) == 6:
-                r = int(color_str[0:2], 16) / 255
-                g = int(color_str[2:4], 16) / 255
-                b = int(color_str[4:6], 16) / 255
-                return (r, g, b, 0.9)
-
-            return (0.21, 0.52, 0.89, 0.9)  # Fallback blue
-
-        except ValueError:
-            return (0.21, 0.52, 0.89, 0.9)  # Fallback blue
+        return _parse_color_cached(color_str)
 
     def clear(self):
         """Clear all data"""
-        self._values = []
+        self._values = array("f")
+        self._downsampled = None
+        self._auto_min = None
+        self._auto_max = None
         self.queue_draw()
\ No newline at end of file
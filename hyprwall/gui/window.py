@@ -2,6 +2,9 @@
 Main window for hyprwall GTK4 application.
 """
 
+import os
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -14,13 +17,278 @@ try:
 except (ImportError, ValueError) as e:
     raise RuntimeError("GTK4 or libadwaita not available") from e
 
+from hyprwall.core import detect
 from hyprwall.core.api import HyprwallCore
 from hyprwall.gui.utils.thumbnails import _ensure_video_thumb
-from hyprwall.gui.utils.images import _make_picture_from_file
+from hyprwall.gui.utils.images import (
+    _load_pixbuf_scaled,
+    _make_picture_from_file,
+    _make_picture_from_pixbuf,
+)
+from hyprwall.gui.utils import thumb_cache, thumb_pool
 from hyprwall.gui.controllers.library_controller import LibraryController
 # Feature flag: Set to False to use synchronous loading (baseline for debugging layout issues)
 LAZY_LIBRARY_LOADING = False
 
+# Shared pool for thumbnail work (ffmpeg frame grabs, image decodes) so the
+# GTK main thread never blocks on a decode; bounded so bulk selections can't
+# spawn unbounded ffmpeg processes
+_THUMB_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+# Single worker for core status queries (hyprctl calls, session file reads)
+# so the Now Playing refresh never blocks the main loop on IPC; one worker
+# keeps the queries naturally serialized
+_STATUS_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Resource path of the window UI inside the compiled GResource bundle
+_UI_RESOURCE_PATH = "/org/hyprwall/ui/window.ui"
+
+# window.ui contents cached after the first read; without the GResource
+# bundle, repeated window construction parses from memory instead of
+# re-reading the file from disk
+_UI_XML: str | None = None
+
+# Interned CSS class names shared across the hot construction paths
+_CLASS_WALLPAPER_THUMB = "wallpaper-thumb"
+_CLASS_DIM_LABEL = "dim-label"
+_CLASS_CAPTION = "caption"
+_CLASS_HEADING = "heading"
+_CLASS_NP_INFO_ROW = "np-info-row"
+_CLASS_NP_INFO_KEY = "np-info-key"
+_CLASS_NP_HEADING_ROW = "np-heading-row"
+
+# Icon paintables resolved once per (name, size); an icon-theme lookup can
+# touch tens of files, so repeated previews reuse the resolved paintable
+_ICON_CACHE: dict = {}
+
+
+def _remove_all_children(container) -> None:
+    """Detach every child of a container (sibling walk, no Python list)"""
+    child = container.get_first_child()
+    while child:
+        next_child = child.get_next_sibling()
+        container.remove(child)
+        child = next_child
+
+
+def _get_icon_image(icon_name: str, pixel_size: int) -> Gtk.Image:
+    """Create a Gtk.Image from a cached icon paintable"""
+    paintable = _ICON_CACHE.get((icon_name, pixel_size))
+    if paintable is None:
+        theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+        paintable = theme.lookup_icon(
+            icon_name, None, pixel_size, 1, Gtk.TextDirection.NONE, 0
+        )
+        _ICON_CACHE[(icon_name, pixel_size)] = paintable
+
+    image = Gtk.Image.new_from_paintable(paintable)
+    image.set_pixel_size(pixel_size)
+    return image
+
+
+def _try_register_resources() -> bool:
+    """Register the compiled GResource bundle if the build produced one.
+
+    Loading the UI from a registered resource maps the preparsed XML from a
+    single read-only blob instead of stat'ing and parsing window.ui from disk
+    on every window open. The bundle is optional; without it the .ui file and
+    the programmatic fallback behave as before.
+    """
+    bundle = Path(__file__).parent / "ui" / "hyprwall.gresource"
+    try:
+        if bundle.exists():
+            Gio.Resource.load(str(bundle))._register()
+            return True
+    except GLib.Error:
+        pass
+    return False
+
+
+_RESOURCES_REGISTERED = _try_register_resources()
+
+# Builder ids bound as same-named window attributes by _load_from_ui; a typo
+# here (or in the .ui file) is caught by the critical-widget check below
+# instead of surfacing later as a silent None
+_BUILDER_WIDGETS = (
+    "start_button",
+    "stop_button",
+    "monitors_label",
+    "file_chooser_button",
+    "folder_chooser_button",
+    "selected_label",
+    # Main view stack and switcher
+    "main_view_stack",
+    "view_switcher",
+    # Library views
+    "library_page",
+    "library_container",
+    "library_outer_stack",
+    "library_stack",
+    "library_grid",
+    "library_scroll_grid",
+    "library_search_entry",
+    "library_search_results_label",
+    "library_search_list",
+    "library_scroll_search",
+    "library_search_preview_container",
+    "library_search_preview_box",
+    "single_file_preview_slot",
+    "single_file_view_stack",
+    "single_file_list",
+    # Now Playing views
+    "now_playing_container",
+    "now_playing_preview_container",
+    "now_playing_info_list",
+    "now_playing_empty_state",
+    # Performance monitoring
+    "perf_toggle",
+    "perf_widget_container",
+    # Pagination
+    "pagination_bar",
+    "page_prev",
+    "page_next",
+    "page_label",
+    # Controls
+    "mode_dropdown",
+    "profile_dropdown",
+    "codec_dropdown",
+    "encoder_dropdown",
+    "auto_power_switch",
+)
+
+# Widgets the window cannot function without; missing ones fail fast
+_CRITICAL_WIDGETS = ("start_button", "main_view_stack")
+
+# Declarative fallback UI (used when window.ui is missing). One
+# add_from_string call instantiates the tree on the C side instead of ~130
+# lines of per-widget PyGObject construction.
+FALLBACK_UI = """\
+<interface>
+  <object class="GtkBox" id="fallback_content">
+    <property name="orientation">vertical</property>
+    <property name="spacing">12</property>
+    <property name="margin-top">12</property>
+    <property name="margin-bottom">12</property>
+    <property name="margin-start">12</property>
+    <property name="margin-end">12</property>
+    <child>
+      <object class="GtkLabel">
+        <property name="label">HyprWall Manager</property>
+        <style><class name="title-1"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">6</property>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">Detected monitors:</property>
+            <property name="xalign">0</property>
+            <style><class name="dim-label"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkLabel" id="monitors_label">
+            <property name="label">Loading...</property>
+            <property name="xalign">0</property>
+            <property name="wrap">true</property>
+            <property name="hexpand">true</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">horizontal</property>
+        <property name="spacing">6</property>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">Wallpaper:</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="file_chooser_button">
+            <property name="label">Choose file...</property>
+            <property name="hexpand">true</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="folder_chooser_button">
+            <property name="label">Choose folder...</property>
+            <property name="hexpand">true</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkLabel" id="selected_label">
+        <property name="label">Selected: (none)</property>
+        <property name="xalign">0</property>
+        <property name="wrap">true</property>
+        <style><class name="dim-label"/></style>
+      </object>
+    </child>
+    <child>
+      <object class="GtkScrolledWindow" id="library_scroll">
+        <property name="vexpand">true</property>
+        <property name="max-content-height">200</property>
+        <property name="propagate-natural-height">true</property>
+        <property name="visible">false</property>
+        <child>
+          <object class="GtkListBox" id="library_list">
+            <property name="selection-mode">single</property>
+            <style><class name="boxed-list"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkListBox">
+        <property name="selection-mode">none</property>
+        <style><class name="boxed-list"/></style>
+        <child>
+          <object class="AdwExpanderRow" id="controls_expander">
+            <property name="title">Controls</property>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">horizontal</property>
+        <property name="spacing">6</property>
+        <property name="halign">center</property>
+        <child>
+          <object class="GtkButton" id="start_button">
+            <property name="label">Start</property>
+            <style><class name="suggested-action"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="stop_button">
+            <property name="label">Stop</property>
+            <style><class name="destructive-action"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
+# Builder ids bound by the fallback path
+_FALLBACK_WIDGETS = (
+    "monitors_label",
+    "file_chooser_button",
+    "folder_chooser_button",
+    "selected_label",
+    "library_scroll",
+    "library_list",
+    "start_button",
+    "stop_button",
+)
+
 
 
 class HyprwallWindow(Adw.ApplicationWindow):
@@ -32,14 +300,74 @@ class HyprwallWindow(Adw.ApplicationWindow):
     otherwise it builds the UI programmatically.
     """
 
+    # Dropdown option sets, in dropdown order; built once at class definition
+    # instead of as fresh lists inside every click handler
+    _MODES = ("auto", "fit", "cover", "stretch")
+    _PROFILES = ("off", "eco", "balanced", "quality")
+    _CODECS = ("h264", "vp9", "av1")
+    _ENCODERS = ("auto", "cpu", "vaapi", "nvenc")
+
+    # Shared (filter, store) pair for the media file dialog; built on
+    # first use and reused by every window
+    _MEDIA_FILTERS = None
+
+    # Shared app-menu model; the items never change, so one Gio.Menu
+    # serves every window
+    _APP_MENU = None
+
+    @classmethod
+    def _get_app_menu(cls):
+        """Return the shared header-bar menu model, building it once"""
+        if cls._APP_MENU is None:
+            menu = Gio.Menu()
+
+            # Cache section
+            cache_menu = Gio.Menu()
+            cache_menu.append("Cache Size", "win.cache-size")
+            cache_menu.append("Clear Cache", "win.cache-clear")
+            cache_menu.append("Reset Default Folder", "win.reset-default-folder")
+            menu.append_section("Cache", cache_menu)
+
+            # App actions
+            menu.append("Preferences", "app.preferences")
+            menu.append("About", "app.about")
+            menu.append("Quit", "app.quit")
+            cls._APP_MENU = menu
+        return cls._APP_MENU
+
+    @classmethod
+    def _get_media_filter_store(cls):
+        """Return the shared media Gtk.FileFilter and its Gio.ListStore"""
+        if cls._MEDIA_FILTERS is None:
+            media_filter = Gtk.FileFilter()
+            media_filter.set_name("Media files")
+            media_filter.add_mime_type("image/*")
+            media_filter.add_mime_type("video/*")
+
+            store = Gio.ListStore.new(Gtk.FileFilter)
+            store.append(media_filter)
+            cls._MEDIA_FILTERS = (media_filter, store)
+        return cls._MEDIA_FILTERS
+
     def __init__(self, application, core: HyprwallCore):
         super().__init__(application=application)
 
         self.core = core
 
-        # Try to load UI from .ui file
+        # Assigned after the UI is built; None until then so early signal
+        # callbacks can test `is None` instead of hasattr
+        self.library_controller = None
+
+        # File/folder dialogs and their filter objects, created on first
+        # use and reused across clicks
+        self._file_dialog = None
+        self._folder_dialog = None
+
+        # Try to load UI from the GResource bundle, then the .ui file
         ui_path = Path(__file__).parent / "ui" / "window.ui"
-        if ui_path.exists():
+        if _RESOURCES_REGISTERED:
+            self._load_from_ui(None)
+        elif ui_path.exists():
             self._load_from_ui(ui_path)
         else:
             self._build_ui_programmatically()
@@ -50,90 +378,94 @@ class HyprwallWindow(Adw.ApplicationWindow):
         # Auto-load default library directory at startup (after controller creation)
         self._auto_load_default_library()
 
+        # Defer the first status fetch until the window is mapped so the
+        # first frame isn't held back by a hyprctl round-trip
+        self._map_handler = self.connect("map", self._on_first_map)
+
+    def _on_first_map(self, *_args):
+        """One-shot map handler: kick off the initial status refresh"""
+        self.disconnect(self._map_handler)
+        self._map_handler = None
+
         # Load initial status
         self._refresh_status()
 
         # Initialize Now Playing view (in case wallpaper is already running)
-        if hasattr(self, '_refresh_now_playing'):
-            GLib.idle_add(self._refresh_now_playing)
+        self._queue_now_playing_refresh()
+
+    def _load_from_ui(self, ui_path: Path | None):
+        """Load the UI using GtkBuilder (from GResource when ui_path is None)"""
+        global _UI_XML
 
-    def _load_from_ui(self, ui_path: Path):
-        """Load the UI from a .ui file using GtkBuilder"""
         builder = Gtk.Builder()
-        builder.add_from_file(str(ui_path))
-
-        # Get widgets
-        self.start_button = builder.get_object("start_button")
-        self.stop_button = builder.get_object("stop_button")
-        self.monitors_label = builder.get_object("monitors_label")
-        self.file_chooser_button = builder.get_object("file_chooser_button")
-        self.folder_chooser_button = builder.get_object("folder_chooser_button")
-        self.selected_label = builder.get_object("selected_label")
-
-        # Main view stack and switcher
-        self.main_view_stack = builder.get_object("main_view_stack")
-        self.view_switcher = builder.get_object("view_switcher")
-
-        # Library views
-        self.library_page = builder.get_object("library_page")
-        self.library_container = builder.get_object("library_container")
-        self.library_outer_stack = builder.get_object("library_outer_stack")
-        self.library_stack = builder.get_object("library_stack")
-        self.library_grid = builder.get_object("library_grid")
-        self.library_scroll_grid = builder.get_object("library_scroll_grid")
-        self.library_search_entry = builder.get_object("library_search_entry")
-        self.library_search_results_label = builder.get_object("library_search_results_label")
-        self.library_search_list = builder.get_object("library_search_list")
-        self.library_scroll_search = builder.get_object("library_scroll_search")
-        self.library_search_preview_container = builder.get_object("library_search_preview_container")
-        self.library_search_preview_box = builder.get_object("library_search_preview_box")
-        self.single_file_preview_box = builder.get_object("single_file_preview_box")
-        self.single_file_view_stack = builder.get_object("single_file_view_stack")
-        self.single_file_list = builder.get_object("single_file_list")
-
-        # Now Playing views
-        self.now_playing_container = builder.get_object("now_playing_container")
-        self.now_playing_preview_container = builder.get_object("now_playing_preview_container")
-        self.now_playing_info_list = builder.get_object("now_playing_info_list")
-        self.now_playing_empty_state = builder.get_object("now_playing_empty_state")
-
-        # Performance monitoring
-        self.perf_toggle = builder.get_object("perf_toggle")
-        self.perf_widget_container = builder.get_object("perf_widget_container")
+        if ui_path is None:
+            builder.add_from_resource(_UI_RESOURCE_PATH)
+        else:
+            if _UI_XML is None:
+                _UI_XML = ui_path.read_text(encoding="utf-8")
+            builder.add_from_string(_UI_XML)
+
+        # Get widgets (table-driven: see _BUILDER_WIDGETS)
+        get_object = builder.get_object
+        for name in _BUILDER_WIDGETS:
+            setattr(self, name, get_object(name))
+
+        for name in _CRITICAL_WIDGETS:
+            if getattr(self, name) is None:
+                raise RuntimeError(f"UI definition is missing required widget: {name}")
+
+        self.single_file_preview_box = None  # Current inner box, swapped per preview
         self.perf_widget = None  # Will be created on demand
 
-        # Pagination
-        self.pagination_bar = builder.get_object("pagination_bar")
-        self.page_prev = builder.get_object("page_prev")
-        self.page_next = builder.get_object("page_next")
-        self.page_label = builder.get_object("page_label")
-
-
-        # Controls
-        self.mode_dropdown = builder.get_object("mode_dropdown")
-        self.profile_dropdown = builder.get_object("profile_dropdown")
-        self.codec_dropdown = builder.get_object("codec_dropdown")
-        self.encoder_dropdown = builder.get_object("encoder_dropdown")
-        self.auto_power_switch = builder.get_object("auto_power_switch")
-
-        # Library state
-        self._library_items = []
-        self._library_folder = None
-
-        # Pagination state
-        self._all_items = []
-        self._page_size = 15
-        self._page_index = 0
-        self._total_pages = 1
-
-        # Search state
-        self._all_search_items = []  # All items loaded for search (no pagination)
-        self._filtered_search_items = []  # Filtered results based on search query
-        self._search_loaded = False  # Whether we've loaded all items for search
-
-        # Now Playing refresh timer ID
+        # Library/pagination/search state lives in the controller's
+        # LibraryState (slots dataclass); it is shared onto the window as
+        # self._state when the controller is constructed.
+
+        # Now Playing refresh timer ID (fallback when event socket unavailable)
         self._now_playing_timer = None
 
+        # Hyprland event socket watch (event-driven Now Playing refresh)
+        self._now_playing_watch = None
+        self._now_playing_socket = None
+        self._now_playing_refresh_pending = False
+
+        # Fingerprint of the last rendered Now Playing state; an unchanged
+        # key means the refresh can return without touching any widget
+        self._np_last_key = None
+
+        # Rendered info rows keyed by row id -> (row, value_label), plus the
+        # schema they were built for; value-only changes update labels in
+        # place and rows are recreated only when the schema itself changes
+        self._np_rows = {}
+        self._np_schema = None
+
+        # Monitor lookup map cached behind a topology fingerprint; rebuilt
+        # only when a monitor appears, vanishes or changes resolution
+        self._monitor_map = {}
+        self._monitor_map_sig = None
+
+        # Rendered heading rows, and pools of detached row widgets; schema
+        # rebuilds pop recycled rows instead of constructing new widget
+        # trees (pool size is bounded by the largest schema ever shown)
+        self._np_headings = []
+        self._row_pool = []
+        self._heading_pool = []
+
+        # True while a status fetch is running on the worker; refresh ticks
+        # arriving in the meantime are dropped rather than queued
+        self._np_inflight = False
+
+        # True while a coalesced refresh is queued on the idle loop
+        self._np_refresh_pending = False
+
+        # File currently shown in the Now Playing preview; refreshes for the
+        # same file leave the preview widgets alone
+        self._np_current_preview_file = None
+
+        # Monotonic token so in-flight thumbnail decodes for a previous
+        # selection are discarded instead of racing the current one
+        self._preview_token = 0
+
         # Get content
         content = builder.get_object("window_content")
         if content:
@@ -143,20 +475,7 @@ class HyprwallWindow(Adw.ApplicationWindow):
             # Menu
             menu_button = Gtk.MenuButton()
             menu_button.set_icon_name("open-menu-symbolic")
-            menu = Gio.Menu()
-
-            # Cache section
-            cache_menu = Gio.Menu()
-            cache_menu.append("Cache Size", "win.cache-size")
-            cache_menu.append("Clear Cache", "win.cache-clear")
-            cache_menu.append("Reset Default Folder", "win.reset-default-folder")
-            menu.append_section("Cache", cache_menu)
-
-            # App actions
-            menu.append("Preferences", "app.preferences")
-            menu.append("About", "app.about")
-            menu.append("Quit", "app.quit")
-            menu_button.set_menu_model(menu)
+            menu_button.set_menu_model(self._get_app_menu())
             header.pack_end(menu_button)
 
             # Toolbar view
@@ -182,11 +501,18 @@ class HyprwallWindow(Adw.ApplicationWindow):
         if hasattr(self, 'library_search_entry') and self.library_search_entry:
             self.library_search_entry.connect("search-changed", self._on_library_search_changed)
         if hasattr(self, 'library_search_list') and self.library_search_list:
-            self.library_search_list.connect("row-activated", self._on_library_search_activated)
+            if isinstance(self.library_search_list, Gtk.ListView):
+                self.library_search_list.connect("activate", self._on_library_search_view_activated)
+            else:
+                self.library_search_list.connect("row-activated", self._on_library_search_activated)
 
-        # Main view stack - refresh Now Playing when switched to
+        # Main view stack - refresh Now Playing when switched to. The
+        # visible view name is mirrored in _current_view so hot paths
+        # compare a Python string instead of calling into the stack.
+        self._current_view = None
         if self.main_view_stack:
             self.main_view_stack.connect("notify::visible-child-name", self._on_main_view_changed)
+            self._current_view = self.main_view_stack.get_visible_child_name()
 
         # Performance toggle
         if hasattr(self, 'perf_toggle') and self.perf_toggle:
@@ -201,9 +527,11 @@ class HyprwallWindow(Adw.ApplicationWindow):
         if hasattr(self, 'page_next') and self.page_next:
             self.page_next.connect("clicked", self._on_page_next)
 
-        # Update monitors display
+        # Update monitors display (deferred to idle so the synchronous
+        # hyprctl query doesn't delay the first frame)
+        self._monitors_refresh_pending = False
         if self.monitors_label:
-            self._update_monitors_display()
+            self._queue_monitors_refresh()
 
         # Add window actions for cache management
         cache_size_action = Gio.SimpleAction.new("cache-size", None)
@@ -244,7 +572,7 @@ class HyprwallWindow(Adw.ApplicationWindow):
         self.set_size_request(-1, -1)
 
     def _build_ui_programmatically(self):
-        """Build the UI in Python (fallback if no .ui file)"""
+        """Build the fallback UI (no .ui file) from the embedded Builder XML"""
         # Header bar
         header = Adw.HeaderBar()
 
@@ -258,73 +586,61 @@ class HyprwallWindow(Adw.ApplicationWindow):
         menu_button.set_menu_model(menu)
         header.pack_end(menu_button)
 
-        # Main content
-        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        content.set_margin_top(12)
-        content.set_margin_bottom(12)
-        content.set_margin_start(12)
-        content.set_margin_end(12)
-
-        # Title
-        title = Gtk.Label(label="HyprWall Manager")
-        title.add_css_class("title-1")
-        content.append(title)
-
-        # Monitors display (read-only)
-        monitors_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        monitors_header = Gtk.Label(label="Detected monitors:")
-        monitors_header.set_xalign(0)
-        monitors_header.add_css_class("dim-label")
-        monitors_box.append(monitors_header)
-
-        self.monitors_label = Gtk.Label(label="Loading...")
-        self.monitors_label.set_xalign(0)
-        self.monitors_label.set_wrap(True)
-        self.monitors_label.set_hexpand(True)
-        monitors_box.append(self.monitors_label)
-        content.append(monitors_box)
-
-        # File chooser
-        file_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        file_label = Gtk.Label(label="Wallpaper:")
-        file_box.append(file_label)
-
-        self.file_chooser_button = Gtk.Button(label="Choose file...")
-        self.file_chooser_button.set_hexpand(True)
-        self.file_chooser_button.connect("clicked", self._on_choose_file)
-        file_box.append(self.file_chooser_button)
+        # Instantiate the widget tree in one C-side pass
+        builder = Gtk.Builder()
+        builder.add_from_string(FALLBACK_UI)
+
+        get_object = builder.get_object
+        for name in _FALLBACK_WIDGETS:
+            setattr(self, name, get_object(name))
+        content = get_object("fallback_content")
+
+        # Widgets that only exist in the full .ui layout; set to None so the
+        # shared start/stop/refresh/perf paths can test the attribute
+        # directly instead of guarding with hasattr
+        for name in _BUILDER_WIDGETS:
+            if name not in _FALLBACK_WIDGETS:
+                setattr(self, name, None)
+        self.perf_widget = None
+        self._current_view = None
+        self._np_refresh_pending = False
+
+        # Mode, Profile, and Auto-power controls are built lazily on first
+        # expansion: most sessions never open them.
+        self._controls_built = False
+        self._controls_expander = get_object("controls_expander")
+        self._controls_expander.connect("notify::expanded", self._on_controls_expanded)
 
-        self.folder_chooser_button = Gtk.Button(label="Choose folder...")
-        self.folder_chooser_button.set_hexpand(True)
+        # Connect signals
+        self.file_chooser_button.connect("clicked", self._on_choose_file)
         self.folder_chooser_button.connect("clicked", self._on_choose_folder)
-        file_box.append(self.folder_chooser_button)
-
-        content.append(file_box)
-
-        # Selected file label
-        self.selected_label = Gtk.Label(label="Selected: (none)")
-        self.selected_label.set_xalign(0)
-        self.selected_label.set_wrap(True)
-        self.selected_label.add_css_class("dim-label")
-        content.append(self.selected_label)
-
-        # Library list (initially hidden)
-        self.library_scroll = Gtk.ScrolledWindow()
-        self.library_scroll.set_vexpand(True)
-        self.library_scroll.set_max_content_height(200)
-        self.library_scroll.set_propagate_natural_height(True)
-        self.library_scroll.set_visible(False)
-
-        self.library_list = Gtk.ListBox()
-        self.library_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.library_list.add_css_class("boxed-list")
         self.library_list.connect("row-activated", self._on_library_list_activated)
-        self.library_scroll.set_child(self.library_list)
+        self.start_button.connect("clicked", self._on_start_clicked)
+        self.stop_button.connect("clicked", self._on_stop_clicked)
 
-        content.append(self.library_scroll)
+        # Toolbar view to combine header + content
+        toolbar_view = Adw.ToolbarView()
+        toolbar_view.add_top_bar(header)
+        toolbar_view.set_content(content)
 
-        # Mode, Profile, and Auto-power controls
-        controls_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        self.set_content(toolbar_view)
+        self.set_default_size(600, 400)
+        self.set_title("HyprWall")
+
+        self.selected_file = None
+        self._monitors_refresh_pending = False
+        self._queue_monitors_refresh()
+
+    def _on_controls_expanded(self, row, param):
+        """Build the controls section the first time the expander is opened"""
+        if row.get_expanded():
+            self._ensure_controls_section()
+
+    def _ensure_controls_section(self):
+        """Create mode/profile/auto-power controls on demand (fallback UI only)"""
+        if self._controls_built:
+            return
+        self._controls_built = True
 
         # Mode dropdown
         mode_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -333,15 +649,11 @@ class HyprwallWindow(Adw.ApplicationWindow):
         mode_label.set_xalign(0)
         mode_box.append(mode_label)
 
-        mode_list = Gtk.StringList()
-        mode_list.append("auto")
-        mode_list.append("fit")
-        mode_list.append("cover")
-        mode_list.append("stretch")
+        mode_list = Gtk.StringList.new(list(self._MODES))
         self.mode_dropdown = Gtk.DropDown(model=mode_list)
         self.mode_dropdown.set_hexpand(True)
         mode_box.append(self.mode_dropdown)
-        controls_box.append(mode_box)
+        self._controls_expander.add_row(mode_box)
 
         # Profile dropdown
         profile_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -350,16 +662,12 @@ class HyprwallWindow(Adw.ApplicationWindow):
         profile_label.set_xalign(0)
         profile_box.append(profile_label)
 
-        profile_list = Gtk.StringList()
-        profile_list.append("off")
-        profile_list.append("eco")
-        profile_list.append("balanced")
-        profile_list.append("quality")
+        profile_list = Gtk.StringList.new(list(self._PROFILES))
         self.profile_dropdown = Gtk.DropDown(model=profile_list)
-        self.profile_dropdown.set_selected(2)  # Default to "balanced"
+        self.profile_dropdown.set_selected(self._PROFILES.index("balanced"))
         self.profile_dropdown.set_hexpand(True)
         profile_box.append(self.profile_dropdown)
-        controls_box.append(profile_box)
+        self._controls_expander.add_row(profile_box)
 
         # Auto-power switch
         auto_power_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -375,78 +683,85 @@ class HyprwallWindow(Adw.ApplicationWindow):
         auto_power_hint = Gtk.Label(label="(adaptive profile based on power status)")
         auto_power_hint.set_hexpand(True)
         auto_power_hint.set_xalign(0)
-        auto_power_hint.add_css_class("dim-label")
-        auto_power_hint.add_css_class("caption")
+        auto_power_hint.add_css_class(_CLASS_DIM_LABEL)
+        auto_power_hint.add_css_class(_CLASS_CAPTION)
         auto_power_box.append(auto_power_hint)
 
-        controls_box.append(auto_power_box)
-        content.append(controls_box)
-
-        # Control buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        button_box.set_halign(Gtk.Align.CENTER)
-
-        self.start_button = Gtk.Button(label="Start")
-        self.start_button.add_css_class("suggested-action")
-        self.start_button.connect("clicked", self._on_start_clicked)
-        button_box.append(self.start_button)
-
-        self.stop_button = Gtk.Button(label="Stop")
-        self.stop_button.add_css_class("destructive-action")
-        self.stop_button.connect("clicked", self._on_stop_clicked)
-        button_box.append(self.stop_button)
-
-        content.append(button_box)
+        self._controls_expander.add_row(auto_power_box)
 
-        # Toolbar view to combine header + content
-        toolbar_view = Adw.ToolbarView()
-        toolbar_view.add_top_bar(header)
-        toolbar_view.set_content(content)
-
-        self.set_content(toolbar_view)
-        self.set_default_size(600, 400)
-        self.set_title("HyprWall")
+    def _queue_monitors_refresh(self):
+        """Coalesce monitor-display refreshes into one idle callback"""
+        if self._monitors_refresh_pending:
+            return
+        self._monitors_refresh_pending = True
+        GLib.idle_add(self._do_monitors_refresh_once, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
-        self.selected_file = None
-        self._update_monitors_display()
+    def _do_monitors_refresh_once(self):
+        """Idle callback servicing a queued monitor-display refresh"""
+        self._monitors_refresh_pending = False
+        if self.monitors_label:
+            self._update_monitors_display()
+        return False
 
     def _update_monitors_display(self):
         """Update the read-only monitor display"""
         try:
             monitors = self.core.list_monitors()
-            if monitors:
-                monitor_info = [f"{m.name} {m.width}x{m.height}" for m in monitors]
-                self.monitors_label.set_label(", ".join(monitor_info))
-            else:
-                self.monitors_label.set_label("No monitors detected (are you on Hyprland?)")
         except Exception as e:
+            self._last_monitor_sig = None
             self.monitors_label.set_label(f"Error detecting monitors: {e}")
+            return
 
-    def _on_choose_file(self, button):
-        self.present()
-
-        filter_media = Gtk.FileFilter()
-        filter_media.set_name("Media files")
-        filter_media.add_mime_type("image/*")
-        filter_media.add_mime_type("video/*")
+        # Monitor topology rarely changes; an identical signature skips the
+        # label update (and the layout/CSS pass it would trigger) entirely
+        sig = tuple((m.name, m.width, m.height) for m in monitors)
+        if sig == getattr(self, "_last_monitor_sig", None):
+            return
+        self._last_monitor_sig = sig
 
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(filter_media)
+        self.monitors_label.freeze_notify()
+        try:
+            self.monitors_label.set_label(
+                ", ".join(f"{m.name} {m.width}x{m.height}" for m in monitors)
+                or "No monitors detected (are you on Hyprland?)"
+            )
+        finally:
+            self.monitors_label.thaw_notify()
 
-        dialog = Gtk.FileDialog()
-        dialog.set_title("Choose Wallpaper")
-        dialog.set_filters(filters)
-        dialog.set_default_filter(filter_media)
-        dialog.set_modal(True)
+    def _default_chooser_dir(self) -> Path:
+        """Initial folder for file/folder choosers (stat'ed once, then cached)"""
+        folder = getattr(self, "_default_chooser_folder", None)
+        if folder is None:
+            pictures = Path.home() / "Pictures"
+            folder = pictures if pictures.exists() else Path.home()
+            self._default_chooser_folder = folder
+        return folder
 
+    def _on_choose_file(self, button):
+        # present() costs a compositor roundtrip; skip it when the window
+        # already has focus (the common case - the user just clicked a button)
+        if not self.is_active():
+            self.present()
+
+        # Dialog and filters are built on the first click and reused;
+        # reconstructing the FileFilter/ListStore/FileDialog per click is
+        # avoidable churn
+        if self._file_dialog is None:
+            media_filter, filter_store = self._get_media_filter_store()
+
+            dialog = Gtk.FileDialog()
+            dialog.set_title("Choose Wallpaper")
+            dialog.set_filters(filter_store)
+            dialog.set_default_filter(media_filter)
+            dialog.set_modal(True)
+            self._file_dialog = dialog
+
+        dialog = self._file_dialog
         try:
-            pictures = Path.home() / "Pictures"
-            folder_path = pictures if pictures.exists() else Path.home()
-            dialog.set_initial_folder(Gio.File.new_for_path(str(folder_path)))
+            dialog.set_initial_folder(Gio.File.new_for_path(str(self._default_chooser_dir())))
         except Exception:
             pass
 
-        self._file_dialog = dialog
         button.set_sensitive(False)
 
         try:
@@ -457,7 +772,6 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
     def _on_file_chosen(self, dialog, result):
         self.file_chooser_button.set_sensitive(True)
-        self._file_dialog = None
 
         try:
             file = dialog.open_finish(result)
@@ -472,74 +786,76 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
     def _show_single_file_preview(self, file_path: Path):
         """Show preview of a single selected file in both gallery and list views"""
-        if not hasattr(self, 'single_file_preview_box') or not self.single_file_preview_box:
+        if not hasattr(self, 'single_file_preview_slot') or not self.single_file_preview_slot:
             return
 
-        # Clear previous gallery preview
-        child = self.single_file_preview_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.single_file_preview_box.remove(child)
-            child = next_child
+        # Constant-time clear: build a fresh box offscreen and swap it into
+        # the slot in one detach, instead of removing the previous children
+        # one by one (a signal emission and style invalidation per removal)
+        self.single_file_preview_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
+        self.single_file_preview_box.set_halign(Gtk.Align.CENTER)
 
         # Clear previous list
         if hasattr(self, 'single_file_list') and self.single_file_list:
-            child = self.single_file_list.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.single_file_list.remove(child)
-                child = next_child
+            if hasattr(self.single_file_list, "remove_all"):  # GTK >= 4.12
+                self.single_file_list.remove_all()
+            else:
+                child = self.single_file_list.get_first_child()
+                while child:
+                    next_child = child.get_next_sibling()
+                    self.single_file_list.remove(child)
+                    child = next_child
 
-        # Determine if it's an image or video
-        from hyprwall.core import detect
-        is_video = detect.is_video(file_path)
+        # Determine if it's an image or video (inline suffix-set check; the
+        # module import is hoisted out of this hot path)
+        is_video = file_path.suffix.lower() in detect.VIDEO_EXTS
 
         # Create thumbnail
         thumb_width = 320
         thumb_height = 180
 
         # === GALLERY VIEW ===
-        if is_video:
-            # Try to generate video thumbnail
-            thumb_path = _ensure_video_thumb(file_path, thumb_width, thumb_height)
-            if thumb_path:
-                thumb = _make_picture_from_file(thumb_path, thumb_width, thumb_height, cover=True)
-            else:
-                thumb = None
-
-            if not thumb:
-                # Fallback: icon
-                icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-                icon_box.set_valign(Gtk.Align.CENTER)
-                icon_box.set_halign(Gtk.Align.CENTER)
-                icon_box.set_size_request(thumb_width, thumb_height)
-
-                icon = Gtk.Image.new_from_icon_name("video-x-generic-symbolic")
-                icon.set_pixel_size(64)
-                icon_box.append(icon)
-                self.single_file_preview_box.append(icon_box)
-            else:
-                thumb.set_size_request(thumb_width, thumb_height)
-                thumb.add_css_class("wallpaper-thumb")
-                self.single_file_preview_box.append(thumb)
+        # Served from the in-memory pixbuf cache when this file has been
+        # previewed before; the decode and ffmpeg work only happen on a miss.
+        cache_key = thumb_cache.make_key(file_path, thumb_width, thumb_height)
+        cached = thumb_cache.get(cache_key)
+        if cached is not None:
+            self._preview_token += 1  # Invalidate any in-flight decode
+            thumb = _make_picture_from_pixbuf(cached, cover=True)
+            thumb.set_size_request(thumb_width, thumb_height)
+            thumb.add_css_class(_CLASS_WALLPAPER_THUMB)
+            self.single_file_preview_box.append(thumb)
         else:
-            # Image thumbnail
-            thumb = _make_picture_from_file(file_path, thumb_width, thumb_height, cover=True)
-            if thumb:
-                thumb.set_size_request(thumb_width, thumb_height)
-                thumb.add_css_class("wallpaper-thumb")
-                self.single_file_preview_box.append(thumb)
-            else:
-                # Fallback: icon
-                icon_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-                icon_box.set_valign(Gtk.Align.CENTER)
-                icon_box.set_halign(Gtk.Align.CENTER)
-                icon_box.set_size_request(thumb_width, thumb_height)
+            # Insert a placeholder icon immediately and generate the real
+            # thumbnail on the pool: ffmpeg frame grabs and large decodes take
+            # hundreds of ms and used to block the main thread here. The token
+            # discards stale results if the user selects another file mid-decode.
+            icon_name = "video-x-generic-symbolic" if is_video else "image-x-generic-symbolic"
+            placeholder = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            placeholder.set_valign(Gtk.Align.CENTER)
+            placeholder.set_halign(Gtk.Align.CENTER)
+            placeholder.set_size_request(thumb_width, thumb_height)
+
+            placeholder.append(_get_icon_image(icon_name, 64))
+            self.single_file_preview_box.append(placeholder)
+
+            self._preview_token += 1
+            token = self._preview_token
+
+            def _generate_thumb():
+                # Decode on the worker too: GdkPixbuf file loading is thread-safe
+                # and new_from_file_at_scale hits libjpeg-turbo's reduced-size
+                # decode path, so only the cheap widget wrap stays on the main loop
+                if is_video:
+                    source = thumb_pool.generate_video_thumb(file_path, thumb_width, thumb_height)
+                else:
+                    source = file_path
+                pixbuf = _load_pixbuf_scaled(source, thumb_width, thumb_height) if source else None
+                if pixbuf is not None:
+                    thumb_cache.put(cache_key, pixbuf)
+                GLib.idle_add(self._apply_preview_thumb, token, pixbuf, placeholder)
 
-                icon = Gtk.Image.new_from_icon_name("image-x-generic-symbolic")
-                icon.set_pixel_size(64)
-                icon_box.append(icon)
-                self.single_file_preview_box.append(icon_box)
+            _THUMB_POOL.submit(_generate_thumb)
 
         # Filename label (gallery)
         filename_label = Gtk.Label(label=file_path.name)
@@ -550,11 +866,17 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
         # File type label (gallery)
         type_label = Gtk.Label(label=f"Type: {'Video' if is_video else 'Image'}")
-        type_label.add_css_class("dim-label")
+        type_label.add_css_class(_CLASS_DIM_LABEL)
         self.single_file_preview_box.append(type_label)
 
+        # Attach the populated box in a single operation (the appends above
+        # all happened offscreen, so no freeze/thaw is needed here)
+        self.single_file_preview_slot.set_child(self.single_file_preview_box)
+
         # === LIST VIEW ===
         if hasattr(self, 'single_file_list') and self.single_file_list:
+            self.single_file_list.freeze_notify()
+
             # Create list row with file info
             content = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
             content.set_margin_top(12)
@@ -564,9 +886,7 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
             # Icon
             icon_name = "video-x-generic-symbolic" if is_video else "image-x-generic-symbolic"
-            icon = Gtk.Image.new_from_icon_name(icon_name)
-            icon.set_pixel_size(32)
-            content.append(icon)
+            content.append(_get_icon_image(icon_name, 32))
 
             # File info box
             info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
@@ -576,15 +896,15 @@ class HyprwallWindow(Adw.ApplicationWindow):
             name_label = Gtk.Label(label=file_path.name)
             name_label.set_xalign(0)
             name_label.set_wrap(True)
-            name_label.add_css_class("heading")
+            name_label.add_css_class(_CLASS_HEADING)
             info_box.append(name_label)
 
             # Path + type
             details_label = Gtk.Label(label=f"{file_path.parent} • {'Video' if is_video else 'Image'}")
             details_label.set_xalign(0)
             details_label.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
-            details_label.add_css_class("dim-label")
-            details_label.add_css_class("caption")
+            details_label.add_css_class(_CLASS_DIM_LABEL)
+            details_label.add_css_class(_CLASS_CAPTION)
             info_box.append(details_label)
 
             content.append(info_box)
@@ -596,6 +916,8 @@ class HyprwallWindow(Adw.ApplicationWindow):
             row.set_selectable(False)
             self.single_file_list.append(row)
 
+            self.single_file_list.thaw_notify()
+
         # Hide pagination bar (not relevant for single file)
         if hasattr(self, 'pagination_bar') and self.pagination_bar:
             self.pagination_bar.set_visible(False)
@@ -604,22 +926,38 @@ class HyprwallWindow(Adw.ApplicationWindow):
         if hasattr(self, 'library_outer_stack') and self.library_outer_stack:
             self.library_outer_stack.set_visible_child_name("single_file")
 
+    def _apply_preview_thumb(self, token, pixbuf, placeholder):
+        """Swap the preview placeholder for the decoded thumbnail (main thread)"""
+        if token != self._preview_token:
+            return False  # A newer selection superseded this decode
+
+        if pixbuf is None:
+            return False  # Generation failed; the placeholder icon stays
+
+        thumb = _make_picture_from_pixbuf(pixbuf, cover=True)
+        thumb.set_size_request(320, 180)
+        thumb.add_css_class(_CLASS_WALLPAPER_THUMB)
+        self.single_file_preview_box.remove(placeholder)
+        self.single_file_preview_box.prepend(thumb)
+        return False
+
     def _on_choose_folder(self, button):
         """Open folder chooser dialog"""
-        self.present()
+        if not self.is_active():
+            self.present()
 
-        dialog = Gtk.FileDialog()
-        dialog.set_title("Choose Wallpaper Folder")
-        dialog.set_modal(True)
+        if self._folder_dialog is None:
+            dialog = Gtk.FileDialog()
+            dialog.set_title("Choose Wallpaper Folder")
+            dialog.set_modal(True)
+            self._folder_dialog = dialog
 
+        dialog = self._folder_dialog
         try:
-            pictures = Path.home() / "Pictures"
-            folder_path = pictures if pictures.exists() else Path.home()
-            dialog.set_initial_folder(Gio.File.new_for_path(str(folder_path)))
+            dialog.set_initial_folder(Gio.File.new_for_path(str(self._default_chooser_dir())))
         except Exception:
             pass
 
-        self._folder_dialog = dialog
         button.set_sensitive(False)
 
         try:
@@ -631,30 +969,40 @@ class HyprwallWindow(Adw.ApplicationWindow):
     def _on_folder_chosen(self, dialog, result):
         """Handle folder selection and set as default"""
         self.folder_chooser_button.set_sensitive(True)
-        self._folder_dialog = None
 
         try:
             folder = dialog.select_folder_finish(result)
             if folder:
                 folder_path = Path(folder.get_path())
 
-                # Save as default library directory (calls core API)
-                if not self.core.set_default_library_dir(folder_path):
-                    self._show_error(f"Failed to set default folder: {folder_path}")
-                    return
+                # Persist the default library directory off the main thread
+                # (the core call writes config to disk) and continue in an
+                # idle callback once it has finished
+                def _persist_default_dir():
+                    ok = self.core.set_default_library_dir(folder_path)
+                    GLib.idle_add(self._on_default_dir_set, folder_path, ok)
 
-                # Clear selected_file (switching to folder mode)
-                self.selected_file = None
-                self._update_selected_label()
-
-                # Load library from this folder (switches to library view)
-                self._load_library(folder_path)
+                _THUMB_POOL.submit(_persist_default_dir)
         except GLib.Error:
             # User cancelled the dialog - this is normal, don't show error
             pass
         except Exception as e:
             self._show_error(f"Folder selection error: {e!r}")
 
+    def _on_default_dir_set(self, folder_path: Path, ok: bool):
+        """Finish folder selection on the main thread after the config write"""
+        if not ok:
+            self._show_error(f"Failed to set default folder: {folder_path}")
+            return False
+
+        # Clear selected_file (switching to folder mode)
+        self.selected_file = None
+        self._update_selected_label()
+
+        # Load library from this folder (switches to library view)
+        self._load_library(folder_path)
+        return False
+
     # ===== Library (delegated) =====
 
     def _load_library(self, folder: Path):
@@ -693,6 +1041,9 @@ class HyprwallWindow(Adw.ApplicationWindow):
     def _on_library_search_activated(self, listbox, row):
         return self.library_controller._on_library_search_activated(listbox, row)
 
+    def _on_library_search_view_activated(self, listview, position):
+        return self.library_controller._on_library_search_view_activated(listview, position)
+
     def _show_library_search_preview(self, file_path: Path, media_item=None):
         return self.library_controller._show_library_search_preview(file_path, media_item)
 
@@ -728,7 +1079,7 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
     def _auto_load_default_library(self):
         """Auto-load default library directory at startup (safe guard against early calls)"""
-        if not hasattr(self, "library_controller") or self.library_controller is None:
+        if self.library_controller is None:
             return
         return self.library_controller._auto_load_default_library()
 
@@ -743,70 +1094,88 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
     def _on_start_clicked(self, button):
         """Start wallpaper on all monitors (global-only)"""
-        if not hasattr(self, 'selected_file') or self.selected_file is None:
+        if self.selected_file is None:
             self._show_error("Please choose a file first")
             return
 
+        # Fallback UI builds the controls lazily; materialize them before
+        # reading their values if the user never opened the expander
+        if not getattr(self, "_controls_built", True):
+            self._ensure_controls_section()
+
         # Read UI values
         mode_idx = self.mode_dropdown.get_selected()
-        modes = ["auto", "fit", "cover", "stretch"]
-        mode = modes[mode_idx] if mode_idx < len(modes) else "auto"
+        mode = self._MODES[mode_idx] if mode_idx < len(self._MODES) else "auto"
 
         profile_idx = self.profile_dropdown.get_selected()
-        profiles = ["off", "eco", "balanced", "quality"]
-        profile = profiles[profile_idx] if profile_idx < len(profiles) else "balanced"
+        profile = self._PROFILES[profile_idx] if profile_idx < len(self._PROFILES) else "balanced"
 
         codec_idx = self.codec_dropdown.get_selected()
-        codecs = ["h264", "vp9", "av1"]
-        codec = codecs[codec_idx] if codec_idx < len(codecs) else "h264"
+        codec = self._CODECS[codec_idx] if codec_idx < len(self._CODECS) else "h264"
 
         encoder_idx = self.encoder_dropdown.get_selected()
-        encoders = ["auto", "cpu", "vaapi", "nvenc"]
-        encoder = encoders[encoder_idx] if encoder_idx < len(encoders) else "auto"
+        encoder = self._ENCODERS[encoder_idx] if encoder_idx < len(self._ENCODERS) else "auto"
 
         auto_power = self.auto_power_switch.get_active()
 
-        # Call core API - all business logic is in core
-        try:
-            success = self.core.set_wallpaper(
+        # set_wallpaper spawns mpv/transcoding processes and can block for
+        # seconds; run it on the status worker so the window stays
+        # responsive, and disable the button until the result comes back
+        button.set_sensitive(False)
+        _STATUS_POOL.submit(
+            self._start_wallpaper_worker,
+            dict(
                 source=self.selected_file,
                 mode=mode,
                 profile=profile,
                 codec=codec,
                 encoder=encoder,
                 auto_power=auto_power,
-            )
+            ),
+        )
 
-            if success:
-                self._refresh_status()
-                # Update performance monitoring
-                self._update_perf_monitoring()
-                # Refresh Now Playing if visible
-                if hasattr(self, 'main_view_stack') and self.main_view_stack:
-                    if self.main_view_stack.get_visible_child_name() == "now_playing":
-                        self._refresh_now_playing()
-            else:
-                self._show_error("Failed to start wallpaper")
+    def _start_wallpaper_worker(self, kwargs):
+        """Worker-thread call into core.set_wallpaper (calls core API only)"""
+        try:
+            success = self.core.set_wallpaper(**kwargs)
+            error = None
         except Exception as e:
-            self._show_error(f"Error starting wallpaper: {e}")
+            success = False
+            error = str(e)
+        GLib.idle_add(self._finish_start, success, error)
+
+    def _finish_start(self, success, error):
+        """Main-thread completion of an async wallpaper start"""
+        if self.start_button:
+            self.start_button.set_sensitive(True)
+
+        if success:
+            self._refresh_status()
+            # Refresh Now Playing if visible
+            if self.main_view_stack:
+                if self._current_view == "now_playing":
+                    self._queue_now_playing_refresh()
+        elif error is not None:
+            self._show_error(f"Error starting wallpaper: {error}")
+        else:
+            self._show_error("Failed to start wallpaper")
+        return False
 
     def _on_stop_clicked(self, button):
         """Stop wallpaper on all monitors (global-only)"""
         self.core.stop_wallpaper()
         self._refresh_status()
-        # Stop performance monitoring
-        self._update_perf_monitoring()
         # Refresh Now Playing if visible
-        if hasattr(self, 'main_view_stack') and self.main_view_stack:
-            if self.main_view_stack.get_visible_child_name() == "now_playing":
-                self._refresh_now_playing()
+        if self.main_view_stack:
+            if self._current_view == "now_playing":
+                self._queue_now_playing_refresh()
 
     def _refresh_status(self):
         """Refresh Now Playing view if visible (status info moved to Now Playing tab)"""
         # Refresh Now Playing if visible
-        if hasattr(self, 'main_view_stack') and self.main_view_stack:
-            if self.main_view_stack.get_visible_child_name() == "now_playing":
-                self._refresh_now_playing()
+        if self.main_view_stack:
+            if self._current_view == "now_playing":
+                self._queue_now_playing_refresh()
 
     def _show_error(self, message: str):
         """Display an error message"""
@@ -890,49 +1259,197 @@ class HyprwallWindow(Adw.ApplicationWindow):
         """Called when main view stack changes (Library / Now Playing / Search)"""
         visible_child = stack.get_visible_child_name()
 
+        # notify::visible-child-name can fire for transitions that land on
+        # the same page; a repeated name means nothing to tear down or start
+        if visible_child == self._current_view:
+            return
+        self._current_view = visible_child
+
         if visible_child == "now_playing":
             # Refresh Now Playing view when switched to
-            self._refresh_now_playing()
+            self._queue_now_playing_refresh()
 
-            # Start auto-refresh timer (every 2 seconds)
+            # Prefer event-driven refresh from Hyprland's event socket:
+            # no periodic main-loop wakeups while nothing changes. The 2s
+            # polling timer is only the fallback when the socket is missing.
             if self._now_playing_timer:
                 GLib.source_remove(self._now_playing_timer)
-            self._now_playing_timer = GLib.timeout_add_seconds(2, self._refresh_now_playing_timer)
+                self._now_playing_timer = None
+            if not self._start_now_playing_watch():
+                self._now_playing_timer = GLib.timeout_add_seconds(
+                    5, self._refresh_now_playing_timer, priority=GLib.PRIORITY_DEFAULT_IDLE
+                )
         else:
-            # Stop timer when leaving Now Playing view
+            # Stop timer and event watch when leaving Now Playing view
             if self._now_playing_timer:
                 GLib.source_remove(self._now_playing_timer)
                 self._now_playing_timer = None
+            self._stop_now_playing_watch()
+
+    def _start_now_playing_watch(self) -> bool:
+        """Subscribe to Hyprland's event socket for edge-triggered refreshes.
+
+        Returns True when the watch is active (no polling needed).
+        """
+        if self._now_playing_watch is not None:
+            return True
+
+        sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+        runtime = os.environ.get("XDG_RUNTIME_DIR")
+        if not sig or not runtime:
+            return False
+
+        sock_path = Path(runtime) / "hypr" / sig / ".socket2.sock"
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(sock_path))
+            sock.setblocking(False)
+        except OSError:
+            return False
 
+        self._now_playing_socket = sock
+        self._now_playing_watch = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            sock.fileno(),
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self._on_hypr_event,
+        )
+        return True
+
+    def _stop_now_playing_watch(self):
+        """Tear down the Hyprland event socket watch"""
+        if self._now_playing_watch is not None:
+            GLib.source_remove(self._now_playing_watch)
+            self._now_playing_watch = None
+        if self._now_playing_socket is not None:
+            try:
+                self._now_playing_socket.close()
+            except OSError:
+                pass
+            self._now_playing_socket = None
+
+    def _on_hypr_event(self, fd, condition):
+        """Handle readable data on Hyprland's event socket"""
+        if condition & (GLib.IOCondition.HUP | GLib.IOCondition.ERR):
+            # Socket gone (compositor restart); fall back to polling
+            self._now_playing_watch = None
+            self._stop_now_playing_watch()
+            if (self.main_view_stack
+                    and self._current_view == "now_playing"
+                    and not self._now_playing_timer):
+                self._now_playing_timer = GLib.timeout_add_seconds(
+                    5, self._refresh_now_playing_timer, priority=GLib.PRIORITY_DEFAULT_IDLE
+                )
+            return False
+
+        try:
+            self._now_playing_socket.recv(4096)  # Drain; payload content not needed
+        except (BlockingIOError, OSError):
+            pass
+
+        # Coalesce event bursts (workspace switches emit several lines) into
+        # a single refresh
+        if not self._now_playing_refresh_pending:
+            self._now_playing_refresh_pending = True
+            GLib.timeout_add(200, self._refresh_now_playing_debounced)
+        return True
+
+    def _refresh_now_playing_debounced(self):
+        """Debounced refresh scheduled from the event socket"""
+        self._now_playing_refresh_pending = False
+        if self.main_view_stack and self._current_view == "now_playing":
+            self._queue_now_playing_refresh()
+        return False
 
     def _refresh_now_playing_timer(self):
         """Timer callback for auto-refreshing Now Playing view"""
-        if self.main_view_stack and self.main_view_stack.get_visible_child_name() == "now_playing":
-            self._refresh_now_playing()
+        # Nothing is visible while the window is unmapped (minimized or on
+        # another workspace); keep the timer alive but skip the refresh
+        if not self.get_mapped():
+            return True
+        if self.main_view_stack and self._current_view == "now_playing":
+            self._queue_now_playing_refresh()
             return True  # Continue timer
         return False  # Stop timer
 
+    def _queue_now_playing_refresh(self):
+        """Coalesce refresh triggers into a single idle-time refresh.
+
+        Start, stop, view switches and timer ticks can all request a
+        refresh back-to-back; the pending flag collapses a burst into one
+        pass per idle cycle.
+        """
+        if self._np_refresh_pending:
+            return
+        self._np_refresh_pending = True
+        GLib.idle_add(self._do_refresh_now_playing_once, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _do_refresh_now_playing_once(self):
+        """Idle callback running the coalesced refresh"""
+        self._np_refresh_pending = False
+        self._refresh_now_playing()
+        return False
+
     def _refresh_now_playing(self):
         """Refresh the Now Playing view with current status (calls core API only)"""
         # Check if widgets are properly initialized
-        if not hasattr(self, 'now_playing_container') or not self.now_playing_container:
+        if not self.now_playing_container:
             return False
 
+        # The status queries shell out to hyprctl and read session files;
+        # run them on the status worker and marshal the result back so the
+        # main loop never stalls on IPC. One in-flight fetch is enough —
+        # ticks arriving while it runs are dropped, not queued.
+        if self._np_inflight:
+            return False
+        self._np_inflight = True
+        _STATUS_POOL.submit(self._fetch_now_playing)
+        return False
+
+    def _fetch_now_playing(self):
+        """Worker-thread fetch of everything the Now Playing view renders"""
         try:
-            # Get status from core
             status = self.core.get_status()
+            running = bool(status.running and status.monitors)
+            sess = self.core.load_session() if running else None
+            monitors = self.core.list_monitors() if running else []
+        except Exception:
+            status = None
+            sess = None
+            monitors = []
+        GLib.idle_add(self._apply_now_playing, status, sess, monitors)
+
+    def _apply_now_playing(self, status, sess, monitors):
+        """Apply a fetched Now Playing state on the main thread"""
+        self._np_inflight = False
+        try:
+            if status is None:
+                raise RuntimeError("status fetch failed")
+            running = bool(status.running and status.monitors)
+
+            # Rebuild the view only when the observable state changed;
+            # steady-state ticks stop at this tuple comparison instead of
+            # clearing and re-creating every row and preview
+            key = (
+                running,
+                tuple((n, m.file, m.pid, m.mode) for n, m in status.monitors.items()),
+                (sess.last_profile, sess.codec, sess.encoder, sess.auto_power) if sess else None,
+            )
+            if key != self._np_last_key:
+                self._np_last_key = key
+                if not running:
+                    self._show_now_playing_empty()
+                else:
+                    self._show_now_playing_content(status, sess, monitors)
 
-            if not status.running or not status.monitors:
-                self._show_now_playing_empty()
-            else:
-                self._show_now_playing_content(status)
-
-            # Update performance monitoring if enabled
-            self._update_perf_monitoring()
+            # Update performance monitoring if enabled, reusing the status
+            # this refresh already fetched
+            self._update_perf_monitoring(status)
 
-        except Exception as e:
+        except Exception:
+            self._np_last_key = None
             self._show_now_playing_empty()
-            return False
+        return False
 
     def _show_now_playing_empty(self):
         """Show empty state (no wallpaper running)"""
@@ -941,25 +1458,16 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
         # Hide preview and info
         if self.now_playing_preview_container:
-            # Clear preview
-            child = self.now_playing_preview_container.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.now_playing_preview_container.remove(child)
-                child = next_child
+            _remove_all_children(self.now_playing_preview_container)
+            self._np_current_preview_file = None
 
         if self.now_playing_info_list:
-            # Clear info list
-            while True:
-                row = self.now_playing_info_list.get_row_at_index(0)
-                if row is None:
-                    break
-                self.now_playing_info_list.remove(row)
+            self._recycle_info_rows()
 
         # Show empty state
         self.now_playing_empty_state.set_visible(True)
 
-    def _show_now_playing_content(self, status):
+    def _show_now_playing_content(self, status, sess, monitors):
         """Show Now Playing content with current wallpaper status"""
         if not self.now_playing_container:
             return
@@ -968,48 +1476,55 @@ class HyprwallWindow(Adw.ApplicationWindow):
         if self.now_playing_empty_state:
             self.now_playing_empty_state.set_visible(False)
 
-        # Load session for additional info (profile, codec, encoder)
-        sess = self.core.load_session()
-
         # Get first monitor to show preview
         first_monitor = next(iter(status.monitors.values()), None)
 
+        # Wallpaper basenames, computed once per refresh and reused by the
+        # info rows below
+        basenames = {
+            name: Path(m.file).name if m.file else None
+            for name, m in status.monitors.items()
+        }
+
         # === PREVIEW ===
-        if self.now_playing_preview_container and first_monitor and first_monitor.file:
+        if (
+            self.now_playing_preview_container
+            and first_monitor
+            and first_monitor.file
+            and first_monitor.file != self._np_current_preview_file
+        ):
+            self._np_current_preview_file = first_monitor.file
+
             # Clear existing preview
-            child = self.now_playing_preview_container.get_first_child()
-            while child:
-                next_child = child.get_next_sibling()
-                self.now_playing_preview_container.remove(child)
-                child = next_child
+            _remove_all_children(self.now_playing_preview_container)
 
             file_path = Path(first_monitor.file)
             if file_path.exists():
                 # Try to show preview (image or video thumbnail)
-                from hyprwall.core import detect
-                is_video = detect.is_video(file_path)
+                is_video = file_path.suffix.lower() in detect.VIDEO_EXTS
 
                 if is_video:
                     # Try video thumbnail
                     thumb_path = _ensure_video_thumb(file_path, 320, 180)
                     if thumb_path:
-                        picture = _make_picture_from_file(thumb_path, 320, 180, cover=True)
-                        if picture:
+                        pixbuf = self._np_preview_pixbuf(file_path, thumb_path, 320, 180)
+                        if pixbuf:
+                            picture = _make_picture_from_pixbuf(pixbuf, cover=True)
                             picture.set_size_request(320, 180)
-                            picture.add_css_class("wallpaper-thumb")
+                            picture.add_css_class(_CLASS_WALLPAPER_THUMB)
                             self.now_playing_preview_container.append(picture)
                     else:
                         # Fallback: video icon
-                        icon = Gtk.Image.new_from_icon_name("video-x-generic-symbolic")
-                        icon.set_pixel_size(64)
-                        icon.add_css_class("dim-label")
+                        icon = _get_icon_image("video-x-generic-symbolic", 64)
+                        icon.add_css_class(_CLASS_DIM_LABEL)
                         self.now_playing_preview_container.append(icon)
                 else:
                     # Image preview
-                    picture = _make_picture_from_file(file_path, 400, 225, cover=True)
-                    if picture:
+                    pixbuf = self._np_preview_pixbuf(file_path, file_path, 400, 225)
+                    if pixbuf:
+                        picture = _make_picture_from_pixbuf(pixbuf, cover=True)
                         picture.set_size_request(400, 225)
-                        picture.add_css_class("wallpaper-thumb")
+                        picture.add_css_class(_CLASS_WALLPAPER_THUMB)
                         self.now_playing_preview_container.append(picture)
 
                 # Filename label
@@ -1021,114 +1536,159 @@ class HyprwallWindow(Adw.ApplicationWindow):
 
         # === INFO LIST ===
         if self.now_playing_info_list:
-            # Clear existing info
-            while True:
-                row = self.now_playing_info_list.get_row_at_index(0)
-                if row is None:
-                    break
-                self.now_playing_info_list.remove(row)
-
-            # Running status
-            self._add_now_playing_info_row("Status", "Running" if status.running else "Stopped")
-
-            # Monitor-specific info
-            monitors = self.core.list_monitors()
-            monitor_map = {m.name: m for m in monitors}
+            # Describe the desired rows first as (id, title, value) tuples
+            # (value None marks a section heading), then diff against what is
+            # rendered: while the row schema is unchanged only the value
+            # labels that differ are touched, and rows are created or
+            # destroyed only when the schema itself changes (monitor added,
+            # session info appeared, ...)
+            desired = [("status", "Status", "Running" if status.running else "Stopped")]
+
+            sig = tuple((m.name, m.width, m.height) for m in monitors)
+            if sig != self._monitor_map_sig:
+                self._monitor_map_sig = sig
+                self._monitor_map = {m.name: m for m in monitors}
+            monitor_map = self._monitor_map
 
             for mon_name, mon_status in status.monitors.items():
-                # Section separator
-                separator_row = Gtk.ListBoxRow()
-                separator_label = Gtk.Label(label=f"Monitor: {mon_name}")
-                separator_label.set_xalign(0)
-                separator_label.set_margin_top(8)
-                separator_label.set_margin_bottom(4)
-                separator_label.set_margin_start(12)
-                separator_label.set_margin_end(12)
-                separator_label.add_css_class("heading")
-                separator_row.set_child(separator_label)
-                separator_row.set_activatable(False)
-                separator_row.set_selectable(False)
-                self.now_playing_info_list.append(separator_row)
+                desired.append((f"monitor:{mon_name}", f"Monitor: {mon_name}", None))
 
                 # Resolution (if available)
                 if mon_name in monitor_map:
                     mon = monitor_map[mon_name]
-                    self._add_now_playing_info_row("Resolution", f"{mon.width}x{mon.height}")
+                    desired.append((f"{mon_name}:resolution", "Resolution", f"{mon.width}x{mon.height}"))
 
                 # File
                 if mon_status.file:
-                    file_basename = Path(mon_status.file).name
-                    self._add_now_playing_info_row("File", file_basename)
+                    desired.append((f"{mon_name}:file", "File", basenames[mon_name]))
 
                 # Mode
-                self._add_now_playing_info_row("Mode", mon_status.mode or "auto")
+                desired.append((f"{mon_name}:mode", "Mode", mon_status.mode or "auto"))
 
                 # PID
                 if mon_status.pid:
-                    self._add_now_playing_info_row("PID", str(mon_status.pid))
+                    desired.append((f"{mon_name}:pid", "PID", str(mon_status.pid)))
 
             # Global info from session
             if sess:
-                separator_row = Gtk.ListBoxRow()
-                separator_label = Gtk.Label(label="Session Info")
-                separator_label.set_xalign(0)
-                separator_label.set_margin_top(8)
-                separator_label.set_margin_bottom(4)
-                separator_label.set_margin_start(12)
-                separator_label.set_margin_end(12)
-                separator_label.add_css_class("heading")
-                separator_row.set_child(separator_label)
-                separator_row.set_activatable(False)
-                separator_row.set_selectable(False)
-                self.now_playing_info_list.append(separator_row)
-
-                # Profile
-                profile = sess.last_profile if sess.last_profile else "unknown"
-                self._add_now_playing_info_row("Profile", profile)
-
-                # Codec
+                desired.append(("session", "Session Info", None))
+                desired.append(("session:profile", "Profile", sess.last_profile if sess.last_profile else "unknown"))
                 if sess.codec:
-                    self._add_now_playing_info_row("Codec", sess.codec)
-
-                # Encoder
+                    desired.append(("session:codec", "Codec", sess.codec))
                 if sess.encoder:
-                    self._add_now_playing_info_row("Encoder", sess.encoder)
-
-                # Auto-power
-                auto_power_text = "Yes" if sess.auto_power else "No"
-                self._add_now_playing_info_row("Auto-power", auto_power_text)
+                    desired.append(("session:encoder", "Encoder", sess.encoder))
+                desired.append(("session:auto_power", "Auto-power", "Yes" if sess.auto_power else "No"))
+
+            schema = tuple((row_id, title, value is None) for row_id, title, value in desired)
+            if schema == self._np_schema:
+                for row_id, _title, value in desired:
+                    if value is None:
+                        continue
+                    _row, _key_label, value_label = self._np_rows[row_id]
+                    if value_label.get_label() != value:
+                        value_label.set_label(value)
+            else:
+                # Hide the list for the duration of the rebuild so the
+                # row removals and appends coalesce into a single
+                # allocation/draw pass when it becomes visible again
+                info_list = self.now_playing_info_list
+                info_list.set_visible(False)
+                try:
+                    self._recycle_info_rows()
+                    for row_id, title, value in desired:
+                        if value is None:
+                            self._add_now_playing_heading_row(title)
+                        else:
+                            self._np_rows[row_id] = self._add_now_playing_info_row(title, value)
+                    self._np_schema = schema
+                finally:
+                    info_list.set_visible(True)
+
+    def _np_preview_pixbuf(self, source_path: Path, decode_path: Path, width: int, height: int):
+        """Pixbuf for the Now Playing preview, cached by (path, mtime, size).
+
+        source_path identifies the wallpaper (and keys the cache); for
+        videos decode_path is the extracted thumbnail frame.
+        """
+        cache_key = thumb_cache.make_key(source_path, width, height)
+        pixbuf = thumb_cache.get(cache_key)
+        if pixbuf is None:
+            pixbuf = _load_pixbuf_scaled(decode_path, width, height)
+            if pixbuf is not None:
+                thumb_cache.put(cache_key, pixbuf)
+        return pixbuf
+
+    def _recycle_info_rows(self):
+        """Detach all Now Playing info rows, returning them to the pools"""
+        self._row_pool.extend(self._np_rows.values())
+        self._heading_pool.extend(self._np_headings)
+        self._np_rows = {}
+        self._np_headings = []
+        self._np_schema = None
+
+        info_list = self.now_playing_info_list
+        while True:
+            row = info_list.get_row_at_index(0)
+            if row is None:
+                break
+            info_list.remove(row)
+
+    def _add_now_playing_heading_row(self, title: str):
+        """Add a section heading row to the Now Playing info list"""
+        if self._heading_pool:
+            row, label = self._heading_pool.pop()
+            label.set_label(title)
+        else:
+            row = Gtk.ListBoxRow()
+            row.add_css_class(_CLASS_NP_HEADING_ROW)
+            label = Gtk.Label(label=title)
+            label.set_xalign(0)
+            label.add_css_class(_CLASS_HEADING)
+            row.set_child(label)
+            row.set_activatable(False)
+            row.set_selectable(False)
+        self.now_playing_info_list.append(row)
+        self._np_headings.append((row, label))
+        return row
 
     def _add_now_playing_info_row(self, label: str, value: str):
-        """Add a key-value row to the Now Playing info list"""
+        """Add a key-value row to the Now Playing info list.
+
+        Returns (row, key_label, value_label) so refreshes can update the
+        labels in place without rebuilding the row.
+        """
         if not self.now_playing_info_list:
-            return
+            return None
 
-        row = Gtk.ListBoxRow()
-        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-
-        # Label (key)
-        key_label = Gtk.Label(label=label + ":")
-        key_label.set_xalign(0)
-        key_label.set_width_chars(15)
-        key_label.add_css_class("dim-label")
-        box.append(key_label)
-
-        # Value
-        value_label = Gtk.Label(label=value)
-        value_label.set_xalign(0)
-        value_label.set_hexpand(True)
-        value_label.set_wrap(True)
-        value_label.set_selectable(True)
-        box.append(value_label)
-
-        row.set_child(box)
-        row.set_activatable(False)
-        row.set_selectable(False)
+        if self._row_pool:
+            row, key_label, value_label = self._row_pool.pop()
+            key_label.set_label(label + ":")
+            value_label.set_label(value)
+        else:
+            row = Gtk.ListBoxRow()
+            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+            box.add_css_class(_CLASS_NP_INFO_ROW)
+
+            # Label (key)
+            key_label = Gtk.Label(label=label + ":")
+            key_label.set_xalign(0)
+            key_label.add_css_class(_CLASS_NP_INFO_KEY)
+            key_label.add_css_class(_CLASS_DIM_LABEL)
+            box.append(key_label)
+
+            # Value
+            value_label = Gtk.Label(label=value)
+            value_label.set_xalign(0)
+            value_label.set_hexpand(True)
+            value_label.set_wrap(True)
+            value_label.set_selectable(True)
+            box.append(value_label)
+
+            row.set_child(box)
+            row.set_activatable(False)
+            row.set_selectable(False)
         self.now_playing_info_list.append(row)
+        return row, key_label, value_label
 
     # ===== PERFORMANCE MONITORING =====
 
@@ -1162,7 +1722,7 @@ class HyprwallWindow(Adw.ApplicationWindow):
             self.perf_widget.set_visible(False)  # Hidden initially
 
             # Add to container
-            if hasattr(self, 'perf_widget_container') and self.perf_widget_container:
+            if self.perf_widget_container:
                 self.perf_widget_container.append(self.perf_widget)
 
         except ImportError as e:
@@ -1171,30 +1731,37 @@ class HyprwallWindow(Adw.ApplicationWindow):
             self.perf_widget = None
 
             # Disable toggle
-            if hasattr(self, 'perf_toggle') and self.perf_toggle:
+            if self.perf_toggle:
                 self.perf_toggle.set_active(False)
                 self.perf_toggle.set_sensitive(False)
 
-    def _update_perf_monitoring(self):
-        """Update performance monitoring with current wallpaper PID"""
+    def _update_perf_monitoring(self, status=None):
+        """Update performance monitoring with current wallpaper PID.
+
+        Callers that already hold a fresh status (the Now Playing refresh)
+        pass it in so each tick issues a single get_status; without one the
+        method fetches its own.
+        """
         if not self.perf_widget or not self.perf_widget.get_visible():
             return
 
         try:
-            # Get status from core
-            status = self.core.get_status()
+            # Get status from core unless the caller already fetched one
+            if status is None:
+                status = self.core.get_status()
 
             if status.running and status.monitors:
                 # Get PID from first monitor (mpvpaper process)
                 first_monitor_status = next(iter(status.monitors.values()))
                 pid = first_monitor_status.pid
 
-                # Start monitoring (FPS and Power removed)
-                self.perf_widget.set_pid(pid)
+                # Start monitoring (FPS and Power removed); a repeated
+                # PID short-circuits inside the widget
+                self.perf_widget.update_pid_if_changed(pid)
             else:
                 # No wallpaper running
-                self.perf_widget.set_pid(None)
+                self.perf_widget.update_pid_if_changed(None)
 
         except Exception:
             # Silently fail
-            self.perf_widget.set_pid(None)
\ No newline at end of file
+            self.perf_widget.update_pid_if_changed(None)
\ No newline at end of file
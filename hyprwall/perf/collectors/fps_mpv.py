@@ -8,25 +8,54 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 import json
+import os
+import selectors
 import socket
 import time
 
+try:
+    # Optional accelerated JSON parser; both its decode error and the
+    # stdlib's subclass ValueError, so call sites catch that
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 class MPVFPSCollector:
     """
     Collects FPS from mpv via IPC socket.
 
     Design:
-    - Non-blocking socket operations
+    - Persistent non-blocking connection per pid (no connect/close per poll)
     - Returns None if IPC not available
     - Caches socket path for process
     """
 
+    # The property request never changes; encode it once instead of
+    # re-serializing the same dict every poll
+    _REQ_BYTES = (
+        json.dumps({"command": ["get_property", "estimated-vf-fps"]}) + "\n"
+    ).encode("utf-8")
+
+    # Seconds before a failed socket lookup may rescan /proc via psutil
+    _NEGATIVE_TTL = 5.0
+
+    # Sentinel distinguishing "no reply buffered yet" from a None result
+    _NO_REPLY = object()
+
     def __init__(self):
         """Initialize the FPS collector"""
-        self._socket_cache: dict[int, Optional[Path]] = {}
+        # pid -> (path, expiry); a None path is a cached miss that expires
+        self._socket_cache: dict[int, tuple[Optional[Path], float]] = {}
         self._last_fps: dict[int, float] = {}
-        self._timeout = 0.1  # 100ms socket timeout (non-blocking)
+        self._timeout = 0.1  # 100ms poll budget
+        self._uid = os.getuid()
+
+        # Warm connections and partial-line read buffers keyed by pid; one
+        # selector watches all of them for readiness
+        self._conns: dict[int, socket.socket] = {}
+        self._buffers: dict[int, bytearray] = {}
+        self._selector = selectors.DefaultSelector()
 
     def get_fps(self, pid: int) -> Optional[float]:
         """
@@ -38,94 +67,214 @@ class MPVFPSCollector:
         Returns:
             FPS value or None if unavailable
         """
-        # Find mpv IPC socket
+        return self.get_fps_batch([pid]).get(pid)
+
+    def get_fps_batch(self, pids: list[int]) -> dict[int, Optional[float]]:
+        """
+        Get current FPS for several mpv processes in one poll window.
+
+        Requests go out on every warm connection first, then a single
+        select loop services replies as they arrive, so total latency is
+        bounded by the poll budget instead of the per-pid sum. Pids whose
+        reply misses the budget fall back to their last known value.
+
+        Returns:
+            pid -> FPS value (or None if unavailable)
+        """
+        results: dict[int, Optional[float]] = {}
+        pending: set[int] = set()
+
+        for pid in pids:
+            sock = self._get_conn(pid)
+            if sock is None:
+                results[pid] = None
+                continue
+            try:
+                sock.sendall(self._REQ_BYTES)
+            except OSError:
+                # Connection went away (mpv restart); reconnect next poll
+                self._drop_conn(pid)
+                results[pid] = self._last_fps.get(pid)
+                continue
+            pending.add(pid)
+
+        deadline = time.monotonic() + self._timeout
+        while pending:
+            for pid in tuple(pending):
+                if pid not in self._conns:
+                    # Dropped while draining another fd
+                    results[pid] = self._last_fps.get(pid)
+                    pending.discard(pid)
+                    continue
+                fps = self._parse_reply(pid)
+                if fps is not self._NO_REPLY:
+                    results[pid] = fps
+                    pending.discard(pid)
+
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._fill_buffers(remaining):
+                break
+
+        for pid in pending:
+            results[pid] = self._last_fps.get(pid)
+        return results
+
+    def _parse_reply(self, pid: int):
+        """Consume buffered lines for a pid until a command reply appears.
+
+        Returns the rounded FPS, the last known value for error replies,
+        or _NO_REPLY when no complete reply is buffered yet.
+        """
+        while True:
+            line = self._next_line(pid)
+            if line is None:
+                return self._NO_REPLY
+            try:
+                data = _loads(line)
+            except ValueError:
+                continue
+            # mpv interleaves event notifications on the same stream; only
+            # command replies carry an "error" field
+            if "error" not in data:
+                continue
+            if data.get("error") == "success" and "data" in data:
+                try:
+                    fps = float(data["data"])
+                except (TypeError, ValueError):
+                    return self._last_fps.get(pid)
+                self._last_fps[pid] = fps
+                return round(fps, 1)
+            return self._last_fps.get(pid)
+
+    def _get_conn(self, pid: int) -> Optional[socket.socket]:
+        """Return the warm connection for a pid, creating it on first use"""
+        sock = self._conns.get(pid)
+        if sock is not None:
+            return sock
+
         socket_path = self._find_ipc_socket(pid)
         if not socket_path:
             return None
 
         try:
-            # Connect to socket (with timeout)
             sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             sock.settimeout(self._timeout)
             sock.connect(str(socket_path))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            return None
 
-            # Send get_property command
-            request = {"command": ["get_property", "estimated-vf-fps"]}
-            sock.send((json.dumps(request) + "\n").encode("utf-8"))
+        self._conns[pid] = sock
+        self._buffers[pid] = bytearray()
+        self._selector.register(sock, selectors.EVENT_READ, data=pid)
+        return sock
 
-            # Read response (non-blocking)
-            response = sock.recv(4096).decode("utf-8")
-            sock.close()
+    def _drop_conn(self, pid: int) -> None:
+        """Close and forget the connection for a pid"""
+        sock = self._conns.pop(pid, None)
+        self._buffers.pop(pid, None)
+        if sock is not None:
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+            try:
+                sock.close()
+            except OSError:
+                pass
 
-            # Parse JSON response
-            data = json.loads(response)
-            if data.get("error") == "success" and "data" in data:
-                fps = float(data["data"])
-                self._last_fps[pid] = fps
-                return round(fps, 1)
+    def _next_line(self, pid: int) -> Optional[str]:
+        """Pop one complete IPC line from the pid's buffer, if available"""
+        buf = self._buffers.get(pid)
+        if buf is None:
+            return None
+        idx = buf.find(b"\n")
+        if idx < 0:
+            return None
+        line = bytes(buf[:idx])
+        del buf[:idx + 1]
+        return line.decode("utf-8", "replace")
 
-            return self._last_fps.get(pid)
+    def _fill_buffers(self, timeout: float) -> bool:
+        """Drain readable connections into their buffers.
 
-        except (socket.timeout, socket.error, json.JSONDecodeError, KeyError):
-            # Fallback to last known FPS
-            return self._last_fps.get(pid)
+        Returns False when nothing became readable within the timeout.
+        """
+        ready = self._selector.select(timeout)
+        if not ready:
+            return False
+        for key, _events in ready:
+            conn_pid = key.data
+            try:
+                chunk = key.fileobj.recv(4096)
+            except BlockingIOError:
+                continue
+            except OSError:
+                self._drop_conn(conn_pid)
+                continue
+            if not chunk:
+                # Peer closed the stream
+                self._drop_conn(conn_pid)
+                continue
+            self._buffers[conn_pid].extend(chunk)
+        return True
 
     def _find_ipc_socket(self, pid: int) -> Optional[Path]:
         """
         Find mpv IPC socket for a process.
 
         Strategy:
-        1. Check /tmp/mpv-ipc-{pid}
-        2. Check /run/user/{uid}/mpv-socket-{pid}
-        3. Search /proc/{pid}/fd for socket connections
+        1. Check the well-known filesystem locations (one stat each)
+        2. Only then scan the process's unix sockets via psutil, caching a
+           miss for a few seconds so repeated polls don't re-walk /proc
 
         Returns:
             Path to socket or None
         """
-        # Check cache first
-        if pid in self._socket_cache:
-            cached = self._socket_cache[pid]
-            if cached and cached.exists():
-                return cached
-
-        # Common socket locations
-        candidates = [
+        cached = self._socket_cache.get(pid)
+        if cached is not None:
+            path, expiry = cached
+            if path is not None:
+                if path.is_socket():
+                    return path
+            elif time.monotonic() < expiry:
+                return None
+
+        # Common socket locations; is_socket() implies existence, so each
+        # candidate costs a single stat
+        candidates = (
             Path(f"/tmp/mpv-ipc-{pid}"),
             Path(f"/tmp/mpvsocket{pid}"),
-        ]
-
-        # Try user runtime dir
-        try:
-            import os
-            uid = os.getuid()
-            candidates.append(Path(f"/run/user/{uid}/mpv-socket-{pid}"))
-        except Exception:
-            pass
-
-        # Check candidates
+            Path(f"/run/user/{self._uid}/mpv-socket-{pid}"),
+        )
         for candidate in candidates:
-            if candidate.exists() and candidate.is_socket():
-                self._socket_cache[pid] = candidate
+            if candidate.is_socket():
+                self._socket_cache[pid] = (candidate, 0.0)
                 return candidate
 
-        # Try to find socket from /proc/fd (requires psutil)
+        # Expensive fallback: /proc scan (requires psutil)
         try:
             import psutil
             process = psutil.Process(pid)
             for conn in process.net_connections(kind="unix"):
                 if conn.laddr and "mpv" in str(conn.laddr):
                     sock_path = Path(str(conn.laddr))
-                    if sock_path.exists():
-                        self._socket_cache[pid] = sock_path
+                    if sock_path.is_socket():
+                        self._socket_cache[pid] = (sock_path, 0.0)
                         return sock_path
         except Exception:
             pass
 
-        # Not found
-        self._socket_cache[pid] = None
+        # Cache the miss so the /proc walk is amortized across polls
+        self._socket_cache[pid] = (None, time.monotonic() + self._NEGATIVE_TTL)
         return None
 
     def clear_cache(self):
-        """Clear socket path cache"""
+        """Clear socket path cache and drop warm connections"""
+        for pid in list(self._conns):
+            self._drop_conn(pid)
         self._socket_cache.clear()
         self._last_fps.clear()
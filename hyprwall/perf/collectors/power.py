@@ -8,6 +8,7 @@ from energy_uj deltas over time.
 from __future__ import annotations
 from pathlib import Path
 from typing import Optional
+import os
 import time
 
 
@@ -24,9 +25,10 @@ class PowerCollector:
 
     def __init__(self):
         """Initialize the power collector"""
+        self._rapl_fd: Optional[int] = None
         self._rapl_path = self._detect_rapl_path()
         self._last_energy_uj: Optional[int] = None
-        self._last_timestamp: Optional[float] = None
+        self._last_timestamp_ns: Optional[int] = None
         self._last_watts: Optional[float] = None
 
     def get_power_watts(self) -> Optional[float]:
@@ -40,23 +42,25 @@ class PowerCollector:
             This measures total package power, not just the wallpaper process.
             It's useful for monitoring overall system impact.
         """
-        if not self._rapl_path:
+        if self._rapl_fd is None:
             return None
 
         try:
-            # Read current energy counter (microjoules)
-            energy_uj = int(self._rapl_path.read_text().strip())
-            now = time.time()
+            # Re-read the energy counter (microjoules) from the fd kept
+            # open since detection: one pread instead of open/read/close
+            buf = os.pread(self._rapl_fd, 32, 0)
+            energy_uj = int(buf.rstrip(b"\n"))
+            now_ns = time.monotonic_ns()
 
             # First reading: just store baseline
-            if self._last_energy_uj is None or self._last_timestamp is None:
+            if self._last_energy_uj is None or self._last_timestamp_ns is None:
                 self._last_energy_uj = energy_uj
-                self._last_timestamp = now
+                self._last_timestamp_ns = now_ns
                 return self._last_watts  # Return cached value or None
 
             # Compute power from energy delta
             energy_delta_j = (energy_uj - self._last_energy_uj) / 1_000_000
-            time_delta_s = now - self._last_timestamp
+            time_delta_s = (now_ns - self._last_timestamp_ns) / 1_000_000_000
 
             # Avoid division by zero
             if time_delta_s < 0.001:
@@ -68,12 +72,12 @@ class PowerCollector:
             # Handle counter rollover (unlikely but possible)
             if watts < 0 or watts > 300:  # Sanity check: 0-300W range
                 self._last_energy_uj = energy_uj
-                self._last_timestamp = now
+                self._last_timestamp_ns = now_ns
                 return self._last_watts
 
             # Update state
             self._last_energy_uj = energy_uj
-            self._last_timestamp = now
+            self._last_timestamp_ns = now_ns
             self._last_watts = round(watts, 1)
 
             return self._last_watts
@@ -101,10 +105,17 @@ class PowerCollector:
         candidates.append(Path("/sys/class/powercap/amd-rapl/amd-rapl:0/energy_uj"))
 
         for candidate in candidates:
-            if candidate.exists() and candidate.is_file():
+            if candidate.is_file():
                 try:
-                    # Verify readable and contains integer
-                    int(candidate.read_text().strip())
+                    # Verify readable and contains an integer; keep the fd
+                    # open so polls can pread instead of reopening
+                    fd = os.open(str(candidate), os.O_RDONLY)
+                    try:
+                        int(os.pread(fd, 32, 0).rstrip(b"\n"))
+                    except (OSError, ValueError):
+                        os.close(fd)
+                        raise
+                    self._rapl_fd = fd
                     return candidate
                 except (OSError, ValueError):
                     continue
@@ -114,7 +125,19 @@ class PowerCollector:
     def reset(self):
         """Reset baseline (call when switching wallpapers)"""
         self._last_energy_uj = None
-        self._last_timestamp = None
+        self._last_timestamp_ns = None
+
+    def close(self):
+        """Release the RAPL file descriptor"""
+        if self._rapl_fd is not None:
+            try:
+                os.close(self._rapl_fd)
+            except OSError:
+                pass
+            self._rapl_fd = None
+
+    def __del__(self):
+        self.close()
 
     @property
     def available(self) -> bool:
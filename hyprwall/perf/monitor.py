@@ -6,9 +6,12 @@ Designed to be lightweight, non-intrusive, and fail-safe.
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
+import atexit
+import os
 import time
 
 
@@ -34,28 +37,113 @@ class WallpaperPerfMonitor:
     - Non-intrusive: no heavy dependencies, graceful degradation
     """
 
+    # Seconds a cached psutil children list is trusted before re-scanning
+    _CHILDREN_TTL = 5.0
+
+    # hwmon name -> priority for the CPU sensor; specific driver names
+    # outrank a generic "cpu" label (e.g. thinkpad's)
+    _CPU_SENSOR_PRIORITY = {"k10temp": 2, "coretemp": 2, "zenpower": 2, "cpu": 1}
+    _GPU_SENSOR_NAMES = ("amdgpu", "nouveau", "i915", "radeon")
+
     def __init__(self):
         """Initialize the performance monitor"""
         self._last_sample_time = 0.0
         self._sample_interval = 1.0  # Minimum interval between samples (seconds)
 
-        # Smoothing (rolling average to avoid spikes)
+        # Smoothing (rolling average to avoid spikes); deque maxlen
+        # evicts the oldest sample in O(1) instead of a list pop(0)
         self._history_size = 3
-        self._cpu_history: list[float] = []
-        self._ram_history: list[float] = []
-        self._gpu_history: list[float] = []
+        self._cpu_history: deque[float] = deque(maxlen=self._history_size)
+        self._ram_history: deque[float] = deque(maxlen=self._history_size)
+        self._gpu_history: deque[float] = deque(maxlen=self._history_size)
+
+        # Running sums kept alongside the histories so the smoothed
+        # averages — read on every tick, including the rate-limited
+        # shortcut — never re-sum the deques
+        self._cpu_sum = 0.0
+        self._ram_sum = 0.0
+        self._gpu_sum = 0.0
 
         # Track if we've warmed up CPU measurement for a PID
         self._cpu_warmed_up: set[int] = set()
 
-        # Detect available capabilities once
-        self._psutil_available = self._check_psutil()
-        if not self._psutil_available:
+        # Cached psutil.Process handle: re-resolving it every sample re-parses
+        # /proc/<pid>/stat for no reason when the PID hasn't changed
+        self._proc = None
+        self._proc_pid: Optional[int] = None
+
+        # psutil-fallback children cache: psutil enumerates all of /proc
+        # to build the list, and a stable mpvpaper/mpv pair rarely changes
+        self._children_cache: Optional[tuple[float, list]] = None
+
+        # sensor -> (timestamp, value) so temperature reads honor the
+        # sampling interval too
+        self._temp_cache: dict[str, tuple[float, Optional[float]]] = {}
+
+        # Direct /proc sampling (fast path): per-task children files
+        # exist when CONFIG_PROC_CHILDREN is enabled; without them the
+        # psutil path below remains the fallback
+        self._proc_prev_ticks: dict[int, int] = {}
+        self._proc_prev_ns: Optional[int] = None
+        self._clk_tck = 0
+        self._page_size = 0
+        self._procfs_ok = False
+        try:
+            self._clk_tck = os.sysconf("SC_CLK_TCK")
+            self._page_size = os.sysconf("SC_PAGE_SIZE")
+            with open(f"/proc/self/task/{os.getpid()}/children", "rb"):
+                pass
+            self._procfs_ok = self._clk_tck > 0 and self._page_size > 0
+        except (OSError, ValueError, AttributeError):
+            self._procfs_ok = False
+
+        # Detect available capabilities once; keeping the module object
+        # spares the hot sampling paths a per-call trip through the
+        # import machinery (sys.modules lookup under the import lock)
+        try:
+            import psutil
+            self._psutil = psutil
+        except ImportError:
+            self._psutil = None
             self._log_psutil_unavailable()
+        self._psutil_available = self._psutil is not None
+
+        # NVML state (module + device handle) when in-process NVIDIA
+        # queries are available; None falls back to nvidia-smi
+        self._nvml = None
+        self._nvml_handle = None
+
+        # AMD busy-percent fds, opened once at detection and pread per
+        # sample like the hwmon sensors
+        self._amd_busy_fds: list[int] = []
+
+        # Streaming nvidia-smi fallback: one long-lived sampler process
+        # whose latest (usage, temp) line is kept by a daemon thread
+        self._smi_proc = None
+        self._smi_latest: Optional[tuple[Optional[float], Optional[float]]] = None
+        self._smi_failed = False
 
         self._gpu_backend = self._detect_gpu_backend()
+
+        # Bind the usage reader for the detected backend once; per-tick
+        # dispatch is then a single call through the stored method
+        self._gpu_usage_fn = {
+            "nvidia": self._get_nvidia_usage,
+            "amd": self._get_amd_usage,
+            "intel": self._get_intel_usage,
+        }.get(self._gpu_backend)
+
         self._hwmon_paths = self._detect_hwmon_paths()
 
+        # sysfs supports re-reading at offset 0, so keep one fd per
+        # sensor and pread it each tick instead of open/read/close
+        self._hwmon_fds: dict[str, int] = {}
+        for sensor, path in self._hwmon_paths.items():
+            try:
+                self._hwmon_fds[sensor] = os.open(str(path), os.O_RDONLY)
+            except OSError:
+                pass
+
     def _log_psutil_unavailable(self):
         """Log a warning when psutil is not available"""
         try:
@@ -71,14 +159,6 @@ class WallpaperPerfMonitor:
         except Exception:
             pass
 
-    def _check_psutil(self) -> bool:
-        """Check if psutil is available"""
-        try:
-            import psutil
-            return True
-        except ImportError:
-            return False
-
     def _detect_gpu_backend(self) -> Optional[str]:
         """
         Detect available GPU backend.
@@ -86,12 +166,30 @@ class WallpaperPerfMonitor:
         Returns:
             "nvidia" | "amd" | "intel" | None
         """
-        # NVIDIA
+        # NVIDIA: prefer in-process NVML over spawning nvidia-smi — the
+        # subprocess pays fork/exec plus driver init on every sample
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            self._nvml = pynvml
+            self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            atexit.register(pynvml.nvmlShutdown)
+            return "nvidia"
+        except Exception:
+            self._nvml = None
+            self._nvml_handle = None
+
         if Path("/usr/bin/nvidia-smi").exists():
             return "nvidia"
 
-        # AMD (via radeontop or /sys/class/drm)
-        if any(Path("/sys/class/drm").glob("card*/device/gpu_busy_percent")):
+        # AMD (via /sys/class/drm); the busy-percent files are found and
+        # opened once here so sampling never re-globs the directory
+        for card_path in sorted(Path("/sys/class/drm").glob("card*/device/gpu_busy_percent")):
+            try:
+                self._amd_busy_fds.append(os.open(str(card_path), os.O_RDONLY))
+            except OSError:
+                continue
+        if self._amd_busy_fds:
             return "amd"
 
         # Intel (via intel_gpu_top or similar)
@@ -113,39 +211,70 @@ class WallpaperPerfMonitor:
         if not hwmon_base.exists():
             return paths
 
+        # Single pass with a priority score per entry: specific CPU
+        # drivers beat a generic "cpu" label (thinkpad exposes one), and
+        # the first real GPU sensor wins
+        best_cpu_score = 0
         try:
             for hwmon in hwmon_base.iterdir():
-                name_file = hwmon / "name"
-                if not name_file.exists():
-                    continue
-
                 try:
-                    name = name_file.read_text().strip().lower()
-
-                    # CPU temperature (priority: k10temp > coretemp > zenpower > generic cpu)
-                    # Only set if not already found or if this is a higher priority match
-                    if any(x in name for x in ["coretemp", "k10temp", "zenpower", "cpu"]):
-                        temp_input = hwmon / "temp1_input"
-                        if temp_input.exists():
-                            # Prefer specific CPU sensors over generic "thinkpad" or "cpu"
-                            if "cpu" not in paths or any(x in name for x in ["k10temp", "coretemp", "zenpower"]):
-                                paths["cpu"] = temp_input
-
-                    # GPU temperature (common names: amdgpu, nouveau, i915)
-                    # Don't confuse thinkpad's "cpu"/"gpu" labels with real sensors
-                    if any(x in name for x in ["amdgpu", "nouveau", "i915", "radeon"]):
-                        temp_input = hwmon / "temp1_input"
-                        if temp_input.exists():
-                            paths["gpu"] = temp_input
-
-                except Exception:
+                    name = (hwmon / "name").read_text().strip().lower()
+                except OSError:
                     continue
 
-        except Exception:
+                cpu_score = max(
+                    (score for key, score in self._CPU_SENSOR_PRIORITY.items() if key in name),
+                    default=0,
+                )
+                if cpu_score > best_cpu_score:
+                    temp_input = hwmon / "temp1_input"
+                    if temp_input.exists():
+                        paths["cpu"] = temp_input
+                        best_cpu_score = cpu_score
+
+                if "gpu" not in paths and any(key in name for key in self._GPU_SENSOR_NAMES):
+                    temp_input = hwmon / "temp1_input"
+                    if temp_input.exists():
+                        paths["gpu"] = temp_input
+
+        except OSError:
             pass
 
         return paths
 
+    def _get_process(self, pid: int):
+        """Return a cached psutil.Process for pid (None if gone)"""
+        psutil = self._psutil
+
+        if self._proc is None or self._proc_pid != pid:
+            try:
+                self._proc = psutil.Process(pid)
+                self._proc_pid = pid
+            except psutil.NoSuchProcess:
+                self._invalidate_process()
+                return None
+        return self._proc
+
+    def _invalidate_process(self):
+        """Drop the cached process handle (process died or PID changed)"""
+        self._proc = None
+        self._proc_pid = None
+        self._children_cache = None
+
+    def _get_children(self, process) -> list:
+        """Children of the cached process, re-enumerated at most every 5s.
+
+        Callers drop the cache (via _invalidate_process or by clearing
+        _children_cache) when a cached child turns out to be gone.
+        """
+        now = time.monotonic()
+        cached = self._children_cache
+        if cached is not None and now - cached[0] < self._CHILDREN_TTL:
+            return cached[1]
+        children = process.children(recursive=True)
+        self._children_cache = (now, children)
+        return children
+
     def get_metrics(self, pid: int) -> PerfMetrics:
         """
         Get current performance metrics for a wallpaper process.
@@ -165,36 +294,53 @@ class WallpaperPerfMonitor:
 
         self._last_sample_time = now
 
-        # Collect raw metrics
-        cpu = self._get_cpu_usage(pid)
-        ram = self._get_ram_usage(pid)
+        # Collect raw metrics. CPU and RAM use the same cached process handle,
+        # so one oneshot() spanning both lets psutil serve cpu_percent and
+        # memory_info from a single batch of /proc reads instead of reopening
+        # /proc/<pid>/stat and /proc/<pid>/status per accessor.
+        process = self._get_process(pid) if self._psutil_available else None
+        if process is not None:
+            try:
+                with process.oneshot():
+                    cpu = self._get_cpu_usage(pid)
+                    ram = self._get_ram_usage(pid)
+            except Exception:
+                cpu = self._get_cpu_usage(pid)
+                ram = self._get_ram_usage(pid)
+        else:
+            cpu = self._get_cpu_usage(pid)
+            ram = self._get_ram_usage(pid)
         gpu = self._get_gpu_usage()
         cpu_temp = self._get_temperature("cpu")
         gpu_temp = self._get_temperature("gpu")
 
-        # Update histories (for smoothing)
+        # Update histories (maxlen deques evict the oldest sample; the
+        # running sums shed the evicted value first)
         if cpu is not None:
+            if len(self._cpu_history) == self._history_size:
+                self._cpu_sum -= self._cpu_history[0]
             self._cpu_history.append(cpu)
-            if len(self._cpu_history) > self._history_size:
-                self._cpu_history.pop(0)
+            self._cpu_sum += cpu
 
         if ram is not None:
+            if len(self._ram_history) == self._history_size:
+                self._ram_sum -= self._ram_history[0]
             self._ram_history.append(ram)
-            if len(self._ram_history) > self._history_size:
-                self._ram_history.pop(0)
+            self._ram_sum += ram
 
         if gpu is not None:
+            if len(self._gpu_history) == self._history_size:
+                self._gpu_sum -= self._gpu_history[0]
             self._gpu_history.append(gpu)
-            if len(self._gpu_history) > self._history_size:
-                self._gpu_history.pop(0)
+            self._gpu_sum += gpu
 
         return self._get_smoothed_metrics(now)
 
     def _get_smoothed_metrics(self, timestamp: float) -> PerfMetrics:
         """Return smoothed metrics from history"""
-        cpu_avg = sum(self._cpu_history) / len(self._cpu_history) if self._cpu_history else None
-        ram_avg = sum(self._ram_history) / len(self._ram_history) if self._ram_history else None
-        gpu_avg = sum(self._gpu_history) / len(self._gpu_history) if self._gpu_history else None
+        cpu_avg = self._cpu_sum / len(self._cpu_history) if self._cpu_history else None
+        ram_avg = self._ram_sum / len(self._ram_history) if self._ram_history else None
+        gpu_avg = self._gpu_sum / len(self._gpu_history) if self._gpu_history else None
 
         return PerfMetrics(
             cpu_percent=cpu_avg,
@@ -205,6 +351,86 @@ class WallpaperPerfMonitor:
             timestamp=timestamp,
         )
 
+    def _walk_tree(self, pid: int) -> list[int]:
+        """Return pid plus all descendant pids via /proc children files"""
+        pids = [pid]
+        stack = [pid]
+        while stack:
+            task_dir = f"/proc/{stack.pop()}/task"
+            try:
+                tasks = os.listdir(task_dir)
+            except OSError:
+                continue
+            for tid in tasks:
+                try:
+                    with open(f"{task_dir}/{tid}/children", "rb") as f:
+                        children = f.read().split()
+                except OSError:
+                    continue
+                for child in children:
+                    child_pid = int(child)
+                    pids.append(child_pid)
+                    stack.append(child_pid)
+        return pids
+
+    def _read_stat_ticks(self, pid: int) -> Optional[int]:
+        """utime+stime clock ticks from /proc/<pid>/stat"""
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                data = f.read()
+            # Split after the parenthesized comm (which may contain
+            # spaces); utime/stime are then fields 11 and 12
+            fields = data.rsplit(b") ", 1)[1].split()
+            return int(fields[11]) + int(fields[12])
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def _get_cpu_usage_proc(self, pid: int) -> Optional[float]:
+        """CPU% for the process tree from /proc stat tick deltas"""
+        now_ns = time.monotonic_ns()
+        ticks: dict[int, int] = {}
+        for tree_pid in self._walk_tree(pid):
+            t = self._read_stat_ticks(tree_pid)
+            if t is not None:
+                ticks[tree_pid] = t
+        if pid not in ticks:
+            # Main process gone or unreadable; let the caller fall back
+            return None
+
+        prev = self._proc_prev_ticks
+        prev_ns = self._proc_prev_ns
+        self._proc_prev_ticks = ticks
+        self._proc_prev_ns = now_ns
+
+        if prev_ns is None or not prev:
+            # Baseline sample; report 0.0 so the UI doesn't flicker
+            # through N/A (mirrors the psutil warm-up behavior)
+            return 0.0
+
+        elapsed_s = (now_ns - prev_ns) / 1_000_000_000
+        if elapsed_s <= 0:
+            return 0.0
+
+        delta = sum(
+            t - prev[p] for p, t in ticks.items() if p in prev and t >= prev[p]
+        )
+        return round(delta / self._clk_tck / elapsed_s * 100.0, 1)
+
+    def _get_ram_usage_proc(self, pid: int) -> Optional[float]:
+        """RSS in MiB for the process tree from /proc statm"""
+        total_pages = 0
+        found = False
+        for tree_pid in self._walk_tree(pid):
+            try:
+                with open(f"/proc/{tree_pid}/statm", "rb") as f:
+                    total_pages += int(f.read().split()[1])
+                found = True
+            except (OSError, IndexError, ValueError):
+                continue
+        if not found:
+            return None
+        return round(total_pages * self._page_size / (1024 * 1024), 1)
+
     def _get_cpu_usage(self, pid: int) -> Optional[float]:
         """
         Get CPU usage for process + children.
@@ -212,16 +438,22 @@ class WallpaperPerfMonitor:
         Returns:
             CPU percentage (0-100+) or None if unavailable
         """
+        # Fast path: read stat ticks straight from /proc — no psutil
+        # Process objects, no system-wide /proc walk for children
+        if self._procfs_ok:
+            usage = self._get_cpu_usage_proc(pid)
+            if usage is not None:
+                return usage
+
         if not self._psutil_available:
             return None
 
         try:
-            import psutil
+            psutil = self._psutil
 
-            # Get main process
-            try:
-                process = psutil.Process(pid)
-            except psutil.NoSuchProcess:
+            # Get main process (cached handle)
+            process = self._get_process(pid)
+            if process is None:
                 return None
 
             # Warm up: first call primes the baseline (non-blocking)
@@ -230,7 +462,7 @@ class WallpaperPerfMonitor:
                     # Prime baseline with non-blocking call (returns 0.0 on first call)
                     process.cpu_percent(interval=None)
                     # Also prime children
-                    for child in process.children(recursive=True):
+                    for child in self._get_children(process):
                         try:
                             child.cpu_percent(interval=None)
                         except:
@@ -251,13 +483,20 @@ class WallpaperPerfMonitor:
                 total_cpu += process.cpu_percent(interval=None)
 
                 # Children CPU
-                for child in process.children(recursive=True):
+                for child in self._get_children(process):
                     try:
                         total_cpu += child.cpu_percent(interval=None)
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    except psutil.NoSuchProcess:
+                        # Stale cache entry; rebuild next sample
+                        self._children_cache = None
+                        continue
+                    except psutil.AccessDenied:
                         continue
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            except psutil.NoSuchProcess:
+                self._invalidate_process()
+                return None
+            except psutil.AccessDenied:
                 return None
 
             # Return the measurement (can be 0.0 if process is idle)
@@ -273,15 +512,20 @@ class WallpaperPerfMonitor:
         Returns:
             RAM usage in MiB or None if unavailable
         """
+        # Fast path: sum statm RSS pages straight from /proc
+        if self._procfs_ok:
+            ram = self._get_ram_usage_proc(pid)
+            if ram is not None:
+                return ram
+
         if not self._psutil_available:
             return None
 
         try:
-            import psutil
+            psutil = self._psutil
 
-            try:
-                process = psutil.Process(pid)
-            except psutil.NoSuchProcess:
+            process = self._get_process(pid)
+            if process is None:
                 return None
 
             # Aggregate RSS for process + children
@@ -292,13 +536,20 @@ class WallpaperPerfMonitor:
                 total_rss += process.memory_info().rss
 
                 # Children RSS
-                for child in process.children(recursive=True):
+                for child in self._get_children(process):
                     try:
                         total_rss += child.memory_info().rss
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    except psutil.NoSuchProcess:
+                        # Stale cache entry; rebuild next sample
+                        self._children_cache = None
+                        continue
+                    except psutil.AccessDenied:
                         continue
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+            except psutil.NoSuchProcess:
+                self._invalidate_process()
+                return None
+            except psutil.AccessDenied:
                 return None
 
             # Convert bytes to MiB
@@ -314,51 +565,111 @@ class WallpaperPerfMonitor:
         Returns:
             GPU usage (0-100) or None if unavailable
         """
-        if self._gpu_backend is None:
+        if self._gpu_usage_fn is None:
             return None
 
         try:
-            if self._gpu_backend == "nvidia":
-                return self._get_nvidia_usage()
-            elif self._gpu_backend == "amd":
-                return self._get_amd_usage()
-            elif self._gpu_backend == "intel":
-                return self._get_intel_usage()
+            return self._gpu_usage_fn()
         except Exception:
-            pass
+            return None
 
+    def _get_nvidia_usage(self) -> Optional[float]:
+        """Get NVIDIA GPU usage via NVML, falling back to nvidia-smi"""
+        if self._nvml_handle is not None:
+            return self._get_nvidia_usage_nvml()
+        if self._start_nvidia_stream():
+            latest = self._smi_latest
+            return latest[0] if latest else None
         return None
 
-    def _get_nvidia_usage(self) -> Optional[float]:
-        """Get NVIDIA GPU usage via nvidia-smi"""
+    def _start_nvidia_stream(self) -> bool:
+        """Start the long-lived nvidia-smi sampler on first use.
+
+        One process streaming a line per second amortizes the fork/exec
+        and driver-init cost that a one-shot invocation pays per sample;
+        queries then just read the last parsed line.
+        """
+        if self._smi_proc is not None:
+            return True
+        if self._smi_failed:
+            return False
+
         try:
             import subprocess
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-                capture_output=True,
+            import threading
+            proc = subprocess.Popen(
+                [
+                    "nvidia-smi",
+                    "--query-gpu=utilization.gpu,temperature.gpu",
+                    "--format=csv,noheader,nounits",
+                    "-lms", "1000",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=1,
-                check=False,
             )
-            if result.returncode == 0:
-                usage = float(result.stdout.strip())
-                return round(usage, 1)
         except Exception:
-            pass
-        return None
+            # Binary missing or unlaunchable; don't retry every sample
+            self._smi_failed = True
+            return False
 
-    def _get_amd_usage(self) -> Optional[float]:
-        """Get AMD GPU usage via sysfs"""
+        self._smi_proc = proc
+        threading.Thread(
+            target=self._read_nvidia_stream, args=(proc,), daemon=True
+        ).start()
+        atexit.register(self._stop_nvidia_stream)
+        return True
+
+    def _read_nvidia_stream(self, proc):
+        """Daemon thread: keep the latest (usage, temp) sample"""
         try:
-            # Try gpu_busy_percent (newer kernels)
-            for card_path in Path("/sys/class/drm").glob("card*/device/gpu_busy_percent"):
-                try:
-                    usage = int(card_path.read_text().strip())
-                    return float(usage)
-                except Exception:
+            for line in proc.stdout:
+                parts = line.strip().split(",")
+                if len(parts) != 2:
                     continue
+                try:
+                    usage = float(parts[0])
+                except ValueError:
+                    usage = None
+                try:
+                    temp = float(parts[1])
+                except ValueError:
+                    temp = None
+                self._smi_latest = (usage, temp)
         except Exception:
             pass
+        finally:
+            # Sampler died (driver reload, suspend); allow a respawn on
+            # the next query
+            if self._smi_proc is proc:
+                self._smi_proc = None
+
+    def _stop_nvidia_stream(self):
+        """Terminate the streaming nvidia-smi sampler"""
+        proc = self._smi_proc
+        self._smi_proc = None
+        if proc is not None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+
+    def _get_nvidia_usage_nvml(self) -> Optional[float]:
+        """Get NVIDIA GPU usage via the cached NVML device handle"""
+        try:
+            util = self._nvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+            return round(float(util.gpu), 1)
+        except Exception:
+            return None
+
+    def _get_amd_usage(self) -> Optional[float]:
+        """Get AMD GPU usage from the cached gpu_busy_percent fds"""
+        for fd in self._amd_busy_fds:
+            try:
+                # First readable card wins, matching the old glob order
+                return float(int(os.pread(fd, 8, 0)))
+            except (OSError, ValueError):
+                continue
         return None
 
     def _get_intel_usage(self) -> Optional[float]:
@@ -370,7 +681,7 @@ class WallpaperPerfMonitor:
 
     def _get_temperature(self, sensor: str) -> Optional[float]:
         """
-        Get temperature from hwmon.
+        Get temperature for a sensor, read at most once per interval.
 
         Args:
             sensor: "cpu" or "gpu"
@@ -378,22 +689,75 @@ class WallpaperPerfMonitor:
         Returns:
             Temperature in °C or None if unavailable
         """
-        path = self._hwmon_paths.get(sensor)
-        if path is None or not path.exists():
+        # The smoothed-metrics shortcut calls this on every tick; gate
+        # the actual sysfs/NVML read behind the same 1s sample budget
+        now = time.monotonic()
+        cached = self._temp_cache.get(sensor)
+        if cached is not None and now - cached[0] < self._sample_interval:
+            return cached[1]
+
+        value = self._read_temperature(sensor)
+        self._temp_cache[sensor] = (now, value)
+        return value
+
+    def _read_temperature(self, sensor: str) -> Optional[float]:
+        """Uncached temperature read (NVML, streamed nvidia-smi, hwmon)"""
+        # NVIDIA exposes GPU temperature through NVML, not hwmon
+        if sensor == "gpu" and self._nvml_handle is not None:
+            try:
+                return float(self._nvml.nvmlDeviceGetTemperature(
+                    self._nvml_handle, self._nvml.NVML_TEMPERATURE_GPU
+                ))
+            except Exception:
+                pass
+
+        # Streaming nvidia-smi fallback carries the temperature too
+        if sensor == "gpu" and self._gpu_backend == "nvidia":
+            latest = self._smi_latest
+            if latest is not None:
+                return latest[1]
+
+        fd = self._hwmon_fds.get(sensor)
+        if fd is None:
             return None
 
         try:
-            # hwmon returns millidegrees Celsius
-            temp_millidegrees = int(path.read_text().strip())
-            temp_celsius = temp_millidegrees / 1000.0
-            return round(temp_celsius, 1)
-        except Exception:
+            # hwmon returns millidegrees Celsius; int() tolerates the
+            # trailing newline in the raw bytes
+            temp_millidegrees = int(os.pread(fd, 16, 0))
+            return round(temp_millidegrees / 1000.0, 1)
+        except (OSError, ValueError):
             return None
 
+    def close(self):
+        """Release kept sysfs file descriptors"""
+        # getattr: __del__ may run on a partially constructed instance
+        for fd in getattr(self, "_hwmon_fds", {}).values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._hwmon_fds.clear()
+        for fd in getattr(self, "_amd_busy_fds", []):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._amd_busy_fds.clear()
+
+    def __del__(self):
+        self.close()
+
     def clear_history(self):
         """Clear smoothing history (useful when switching wallpapers)"""
         self._cpu_history.clear()
         self._ram_history.clear()
         self._gpu_history.clear()
+        self._cpu_sum = 0.0
+        self._ram_sum = 0.0
+        self._gpu_sum = 0.0
         self._cpu_warmed_up.clear()
+        self._proc_prev_ticks.clear()
+        self._proc_prev_ns = None
+        self._invalidate_process()
         self._last_sample_time = 0.0
\ No newline at end of file
@@ -6,6 +6,7 @@ Displays wallpaper performance metrics in a clean, non-intrusive dashboard.
 
 from __future__ import annotations
 from typing import Optional
+import threading
 
 try:
     import gi
@@ -46,11 +47,29 @@ class PerformanceWidget(Gtk.Box):
         # Monitor instance
         self._monitor = WallpaperPerfMonitor()
         self._current_pid: Optional[int] = None
-        self._refresh_timer: Optional[int] = None
+        self._worker: Optional[threading.Thread] = None
+        self._worker_stop: Optional[threading.Event] = None
+
+        # Mapped-state flag mirrored from the map/unmap signals so the
+        # worker can skip sampling while hidden without touching GTK
+        # from off the main thread
+        self._is_mapped = False
+        self.connect("map", self._on_mapped)
+        self.connect("unmap", self._on_unmapped)
 
         # Build UI
         self._build_ui()
 
+        # (metric box, PerfMetrics attribute, format) applied in a loop
+        # by _apply_metrics and the reset in stop_monitoring
+        self._metric_specs = (
+            (self._cpu_label, "cpu_percent", "{:.1f}%"),
+            (self._ram_label, "ram_mib", "{:.1f} MiB"),
+            (self._gpu_label, "gpu_percent", "{:.1f}%"),
+            (self._cpu_temp_label, "cpu_temp", "{:.1f}°C"),
+            (self._gpu_temp_label, "gpu_temp", "{:.1f}°C"),
+        )
+
     def _build_ui(self):
         """Build the performance widget UI"""
         # Title
@@ -109,16 +128,12 @@ class PerformanceWidget(Gtk.Box):
         value_label.set_name(f"{name.lower().replace(' ', '_')}_value")
         box.append(value_label)
 
-        return box
+        # Direct reference plus the last displayed string, so updates
+        # don't walk the children and stable metrics skip GTK entirely
+        box._value_label = value_label
+        box._last_value = value
 
-    def _get_value_label(self, metric_box: Gtk.Box) -> Optional[Gtk.Label]:
-        """Extract the value label from a metric box"""
-        child = metric_box.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Label) and "title-3" in child.get_css_classes():
-                return child
-            child = child.get_next_sibling()
-        return None
+        return box
 
     def set_pid(self, pid: Optional[int]):
         """
@@ -137,73 +152,76 @@ class PerformanceWidget(Gtk.Box):
             self.start_monitoring()
 
     def start_monitoring(self):
-        """Start auto-refresh timer"""
-        if self._refresh_timer is not None:
+        """Start the background sampling worker"""
+        if self._worker is not None and self._worker.is_alive():
             return  # Already running
 
-        # Refresh every 1.5 seconds (monitor internally rate-limits to 1s)
-        self._refresh_timer = GLib.timeout_add_seconds(1, self._refresh_metrics)
-
-        # Immediate first refresh
-        self._refresh_metrics()
+        stop = threading.Event()
+        self._worker_stop = stop
+        self._worker = threading.Thread(
+            target=self._metrics_worker,
+            args=(stop,),
+            daemon=True,
+        )
+        self._worker.start()
 
     def stop_monitoring(self):
-        """Stop auto-refresh timer"""
-        if self._refresh_timer is not None:
-            GLib.source_remove(self._refresh_timer)
-            self._refresh_timer = None
+        """Stop the background sampling worker"""
+        if self._worker_stop is not None:
+            # Wakes the worker immediately; any already-posted idle
+            # callback checks the event before touching the UI
+            self._worker_stop.set()
+            self._worker_stop = None
+        self._worker = None
 
         # Reset all labels
-        self._set_metric_value(self._cpu_label, "—")
-        self._set_metric_value(self._ram_label, "—")
-        self._set_metric_value(self._gpu_label, "—")
-        self._set_metric_value(self._cpu_temp_label, "—")
-        self._set_metric_value(self._gpu_temp_label, "—")
-
-    def _refresh_metrics(self) -> bool:
-        """Refresh metrics display (timer callback)"""
-        if self._current_pid is None:
-            return False  # Stop timer
+        for box, _attr, _fmt in self._metric_specs:
+            self._set_metric_value(box, "—")
 
-        # Get metrics
-        metrics = self._monitor.get_metrics(self._current_pid)
+    def _on_mapped(self, *_args):
+        self._is_mapped = True
 
+    def _on_unmapped(self, *_args):
+        self._is_mapped = False
 
-        # Update CPU
-        if metrics.cpu_percent is not None:
-            self._set_metric_value(self._cpu_label, f"{metrics.cpu_percent:.1f}%")
-        else:
-            self._set_metric_value(self._cpu_label, "N/A")
+    def _metrics_worker(self, stop: threading.Event):
+        """
+        Worker thread: samples metrics and posts results to the main loop.
 
-        # Update RAM
-        if metrics.ram_mib is not None:
-            self._set_metric_value(self._ram_label, f"{metrics.ram_mib:.1f} MiB")
-        else:
-            self._set_metric_value(self._ram_label, "N/A")
+        All /proc, hwmon and GPU reads happen here so the GTK thread only
+        ever applies ready PerfMetrics snapshots. Sampling is skipped while
+        the widget is unmapped — nothing would be rendered — and the
+        monitor's internal rate limit stays in place as a second safety
+        net.
+        """
+        while not stop.is_set():
+            pid = self._current_pid
+            if pid is None:
+                break
 
-        # Update GPU
-        if metrics.gpu_percent is not None:
-            self._set_metric_value(self._gpu_label, f"{metrics.gpu_percent:.1f}%")
-        else:
-            self._set_metric_value(self._gpu_label, "N/A")
+            if self._is_mapped:
+                metrics = self._monitor.get_metrics(pid)
+                if stop.is_set():
+                    break
+                GLib.idle_add(self._apply_metrics, metrics, stop)
 
-        # Update CPU temperature
-        if metrics.cpu_temp is not None:
-            self._set_metric_value(self._cpu_temp_label, f"{metrics.cpu_temp:.1f}°C")
-        else:
-            self._set_metric_value(self._cpu_temp_label, "N/A")
+            if stop.wait(1.0):
+                break
 
-        # Update GPU temperature
-        if metrics.gpu_temp is not None:
-            self._set_metric_value(self._gpu_temp_label, f"{metrics.gpu_temp:.1f}°C")
-        else:
-            self._set_metric_value(self._gpu_temp_label, "N/A")
+    def _apply_metrics(self, metrics, stop: threading.Event) -> bool:
+        """Main-thread label updates for one metrics snapshot"""
+        if stop.is_set():
+            return False
 
-        return True  # Continue timer
+        for box, attr, fmt in self._metric_specs:
+            value = getattr(metrics, attr)
+            self._set_metric_value(box, fmt.format(value) if value is not None else "N/A")
 
+        return False
 
     def _set_metric_value(self, metric_box: Gtk.Box, value: str):
-        """Update the value label in a metric box"""
-        value_label = self._get_value_label(metric_box)
-        if value_label:
-            value_label.set_label(value)
\ No newline at end of file
+        """Update the value label in a metric box (no-op when unchanged)"""
+        if metric_box._last_value == value:
+            return
+        metric_box._last_value = value
+        metric_box._value_label.set_label(value)
\ No newline at end of file